@@ -0,0 +1,40 @@
+"""add source/title index to articles
+
+Revision ID: 4c7e2a91d0b3
+Revises: 900723c499ea
+Create Date: 2026-10-15 10:02:17.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4c7e2a91d0b3"
+down_revision: Union[str, None] = "900723c499ea"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - index articles by (source_id, title)."""
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_articles_source_id_title",
+            "articles",
+            ["source_id", "title"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_articles_source_id_title",
+            table_name="articles",
+            postgresql_concurrently=True,
+        )
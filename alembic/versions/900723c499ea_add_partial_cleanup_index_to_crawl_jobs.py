@@ -0,0 +1,46 @@
+"""add partial cleanup index to crawl_jobs
+
+Revision ID: 900723c499ea
+Revises: b1c2d3e4f5g6
+Create Date: 2026-10-15 09:12:44.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "900723c499ea"
+down_revision: Union[str, None] = "b1c2d3e4f5g6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TERMINAL_STATUSES = "status IN ('SUCCESS', 'FAILED', 'FORBIDDEN_BY_ROBOTS')"
+
+
+def upgrade() -> None:
+    """Upgrade schema - index finished crawl jobs by created_at for cleanup."""
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_crawl_jobs_cleanup",
+            "crawl_jobs",
+            ["created_at"],
+            unique=False,
+            postgresql_where=sa.text(TERMINAL_STATUSES),
+            postgresql_concurrently=True,
+            sqlite_where=sa.text(TERMINAL_STATUSES),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_crawl_jobs_cleanup",
+            table_name="crawl_jobs",
+            postgresql_concurrently=True,
+        )
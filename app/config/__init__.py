@@ -47,6 +47,22 @@ class LegacySettings:
     def SQLALCHEMY_DATABASE_URL(self) -> str:
         return self._config.database.sqlalchemy_database_url
 
+    @property
+    def DB_POOL_SIZE(self) -> int:
+        return self._config.database.db_pool_size
+
+    @property
+    def DB_MAX_OVERFLOW(self) -> int:
+        return self._config.database.db_max_overflow
+
+    @property
+    def DB_POOL_RECYCLE(self) -> int:
+        return self._config.database.db_pool_recycle
+
+    @property
+    def DB_USE_NULL_POOL(self) -> bool:
+        return self._config.database.db_use_null_pool
+
     @property
     def MEDIASTACK_BASE_URL(self) -> str:
         return self._config.ingestion.mediastack_base_url
@@ -75,6 +91,10 @@ class LegacySettings:
     def MEDIASTACK_TIMEOUT(self) -> int:
         return self._config.ingestion.mediastack_timeout
 
+    @property
+    def MEDIASTACK_MAX_WORKERS(self) -> int:
+        return self._config.ingestion.mediastack_max_workers
+
     @property
     def ARTICLE_CONTENT_TTL_HOURS(self) -> int:
         return self._config.ingestion.article_content_ttl_hours
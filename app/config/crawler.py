@@ -1,3 +1,6 @@
+import os
+import tempfile
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -10,6 +13,13 @@ class CrawlerConfig(BaseSettings):
     crawler_max_concurrent_domains: int = 3
     crawler_request_timeout: int = 30
     crawler_robots_cache_hours: int = 24
+    # SQLite file for persisting robots.txt across restarts ("" disables it).
+    # Deployments should set CRAWLER_ROBOTS_STORE_PATH to a persistent volume
+    # (the worker image uses /data); the temp-dir fallback only survives for
+    # the life of one container instance, since restarts wipe /tmp.
+    crawler_robots_store_path: str = os.path.join(
+        tempfile.gettempdir(), "aifeelnews_robots_cache.db"
+    )
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -9,6 +9,14 @@ class DatabaseConfig(BaseSettings):
     local_database_url: str = Field(default="", alias="LOCAL_DATABASE_URL")
     database_url: str = Field(default="", alias="DATABASE_URL")
 
+    # Connection pool tuning for long-lived processes (API server)
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_recycle: int = 1800
+    # Short-lived jobs (e.g. ingestion runs) can open a fresh connection per
+    # session instead of keeping idle pooled connections around
+    db_use_null_pool: bool = False
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -12,6 +12,7 @@ class IngestionConfig(BaseSettings):
     )
     mediastack_languages: str = "en"
     mediastack_timeout: int = 10
+    mediastack_max_workers: int = 8
     article_content_ttl_hours: int = 168
 
     model_config = SettingsConfigDict(
@@ -47,6 +47,15 @@ class SentimentConfig(BaseSettings):
         default=1000000, description="Maximum text length for GCP NL API (bytes)"
     )
 
+    gcp_nl_batch_concurrency: int = Field(
+        default=16, description="Worker threads used for batch GCP NL requests"
+    )
+
+    gcp_nl_max_in_flight: int = Field(
+        default=16,
+        description="Maximum concurrent GCP NL requests per process (quota guard)",
+    )
+
     # Fallback Configuration
     enable_fallback: bool = Field(
         default=True, description="Enable fallback to VADER if GCP NL fails"
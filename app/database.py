@@ -1,12 +1,53 @@
-from typing import Generator
+from typing import Any, Dict, Generator
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy.pool import NullPool
 
 from app.config import settings
 
+
+def _engine_options(database_url: str) -> Dict[str, Any]:
+    """
+    Pick connection pool options for the configured database.
+
+    Long-lived processes keep a QueuePool of pre-pinged, periodically
+    recycled connections; DB_USE_NULL_POOL switches short-lived jobs to
+    NullPool so they don't hold idle connections. SQLite keeps
+    SQLAlchemy's default pool.
+    """
+    if database_url.startswith("sqlite"):
+        return {}
+    if settings.DB_USE_NULL_POOL:
+        return {"poolclass": NullPool}
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_pre_ping": True,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_use_lifo": True,
+    }
+
+
 # pick the URL based on ENV
-engine = create_engine(settings.SQLALCHEMY_DATABASE_URL, echo=True)
+engine = create_engine(
+    settings.SQLALCHEMY_DATABASE_URL,
+    echo=True,
+    **_engine_options(settings.SQLALCHEMY_DATABASE_URL),
+)
+
+
+def _enable_sqlite_foreign_keys(dbapi_connection: Any, connection_record: Any) -> None:
+    """Turn on FK enforcement, which SQLite leaves off for every new connection."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+if engine.dialect.name == "sqlite":
+    # Article relationships use passive_deletes, so child rows rely on the
+    # database's ON DELETE CASCADE
+    event.listen(engine, "connect", _enable_sqlite_foreign_keys)
 
 SessionLocal = sessionmaker(
     autocommit=False,
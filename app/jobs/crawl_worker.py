@@ -17,7 +17,7 @@ from typing import Any, Dict, List, Optional
 
 import requests
 from bs4 import BeautifulSoup
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only
 
 from app.config import settings
 from app.database import SessionLocal
@@ -25,12 +25,14 @@ from app.models.article import Article
 from app.models.article_content import ArticleContent
 from app.models.crawl_job import CrawlJob, CrawlStatus
 from app.models.sentiment_analysis import SentimentAnalysis
+from app.utils.article_cache import invalidate_article_cache
 from app.utils.robots import (
     check_robots_compliance,
     get_domain_from_url,
+    prewarm_robots,
     respect_crawl_delay,
 )
-from app.utils.sentiment import analyze_sentiment
+from app.utils.sentiment import analyze_sentiment, get_sentiment_provider
 from app.utils.ttl import calculate_content_expiry
 
 # Configure logging
@@ -38,7 +40,8 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Track last crawl time per domain for rate limiting
-_last_crawl_times: Dict[str, datetime] = {}
+# (time.monotonic() values, compared against robots.txt crawl delays)
+_last_crawl_times: Dict[str, float] = {}
 
 
 def extract_article_text(html_content: str, url: str) -> Optional[str]:
@@ -189,7 +192,7 @@ def crawl_article(crawl_job: CrawlJob, db: Session) -> bool:
         )
 
         # Update crawl timing
-        _last_crawl_times[domain] = datetime.now(timezone.utc)
+        _last_crawl_times[domain] = time.monotonic()
         fetch_time = time.time() - start_time
 
         # Check response
@@ -245,11 +248,10 @@ def crawl_article(crawl_job: CrawlJob, db: Session) -> bool:
         # Step 6: Perform sentiment analysis
         logger.debug(f"Analyzing sentiment for {url}")
 
-        # Get configured provider info
-        from app.config import config
+        # Get the provider analyze_sentiment will use
         from app.utils.sentiment import analyze_sentiment_gcp_nl
 
-        provider = config.sentiment.sentiment_provider
+        provider = get_sentiment_provider()
 
         # Analyze sentiment with the configured provider (English only)
         # We filter to English articles at ingestion
@@ -294,6 +296,8 @@ def crawl_article(crawl_job: CrawlJob, db: Session) -> bool:
         crawl_job.updated_at = datetime.now(timezone.utc)  # type: ignore[assignment]
 
         db.commit()
+        # Cached API responses still carry the article's old sentiment
+        invalidate_article_cache()
 
         # Step 8: Stream to BigQuery for analytics (if enabled)
         try:
@@ -387,8 +391,10 @@ def create_crawl_jobs_for_articles(db: Session, limit: int = 20) -> int:
         Number of crawl jobs created
     """
     # Find articles without crawl jobs
+    # Only id (and url for logging) are needed - skip the wide text columns
     articles_without_jobs = (
         db.query(Article)
+        .options(load_only(Article.id, Article.url))  # type: ignore[arg-type]
         .filter(
             ~Article.id.in_(db.query(CrawlJob.article_id).distinct())
         )  # type: ignore
@@ -448,6 +454,9 @@ def run_crawl_worker(max_jobs: int = 5) -> Dict[str, Any]:
 
         logger.info(f"📋 Found {len(pending_jobs)} pending crawl jobs")
 
+        # Fetch robots.txt for all domains up front rather than per first article
+        prewarm_robots(get_domain_from_url(job.article.url) for job in pending_jobs)
+
         successful_crawls = 0
         failed_crawls = 0
 
@@ -1,13 +1,38 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date
+from typing import Iterator, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from app.config import settings
 from app.jobs.mock_mediastack import fetch_mock_articles_from_source
 from app.jobs.sources_list import SOURCES
 
 
+def _create_session() -> requests.Session:
+    """Create a pooled HTTP session with keep-alive and retries for Mediastack."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared across worker threads so connections to Mediastack are reused
+SESSION = _create_session()
+
+
 def fetch_articles_from_source(source: str) -> list[dict]:
     base_params = {
         "access_key": settings.MEDIASTACK_API_KEY,
@@ -20,7 +45,7 @@ def fetch_articles_from_source(source: str) -> list[dict]:
     }
 
     try:
-        resp = requests.get(
+        resp = SESSION.get(
             settings.MEDIASTACK_BASE_URL,
             params=base_params,  # type: ignore[arg-type]
             timeout=settings.MEDIASTACK_TIMEOUT,
@@ -38,13 +63,26 @@ def fetch_articles_from_source(source: str) -> list[dict]:
         return fetch_mock_articles_from_source(source)
 
 
-def fetch_all_sources() -> list[dict]:
-    all_articles = []
-    for src in SOURCES:
-        logging.info("🔎 Fetching from %s…", src)
-        try:
-            all_articles.extend(fetch_articles_from_source(src))
-        except Exception as e:
-            logging.error("✖ %s: %s", src, e)
-    logging.info("✅ Fetched %d raw articles", len(all_articles))
-    return all_articles
+def iter_source_batches() -> Iterator[Tuple[str, list[dict]]]:
+    """
+    Fetch all sources concurrently, yielding each source's articles as it lands.
+
+    Lets callers normalize and ingest one source at a time instead of
+    holding every source's raw articles in memory at once.
+
+    Yields:
+        Tuple of (source, raw articles) in completion order
+    """
+    workers = max(1, min(settings.MEDIASTACK_MAX_WORKERS, len(SOURCES)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(fetch_articles_from_source, src): src for src in SOURCES
+        }
+        for future in as_completed(futures):
+            src = futures[future]
+            try:
+                articles = future.result()
+            except Exception as e:
+                logging.error("✖ %s: %s", src, e)
+                continue
+            yield src, articles
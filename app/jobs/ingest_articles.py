@@ -1,22 +1,48 @@
-from typing import Dict, List
+from typing import Any, Callable, Dict, List, Set
 
+from sqlalchemy import CursorResult, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from app.models.article import Article
 from app.models.source import Source
+from app.utils.article_cache import invalidate_article_cache
 
 
-def get_or_create_source(db: Session, name: str) -> Source:
-    src = db.query(Source).filter_by(name=name).first()
-    if not src:
-        src = Source(name=name)
-        db.add(src)
-        db.flush()  # assigns src.id
-    return src  # type: ignore[no-any-return]
+def _dialect_insert(db: Session) -> Callable[..., Any]:
+    """Pick the insert construct with ON CONFLICT support for the bound DB."""
+    if db.get_bind().dialect.name == "postgresql":
+        return pg_insert
+    return sqlite_insert
 
 
-def article_exists(db: Session, url: str) -> bool:
-    return db.query(Article).filter_by(url=url).first() is not None
+def get_or_create_source_ids(db: Session, names: Set[str]) -> Dict[str, int]:
+    """
+    Map source names to ids in bulk, creating any sources that don't exist.
+
+    Uses one SELECT for known sources and one multi-row INSERT ... ON
+    CONFLICT DO NOTHING (plus a re-select for the new ids) instead of a
+    query per article.
+    """
+    if not names:
+        return {}
+
+    rows = db.execute(select(Source.name, Source.id).where(Source.name.in_(names)))
+    name_to_id: Dict[str, int] = {name: source_id for name, source_id in rows}
+
+    missing = names - name_to_id.keys()
+    if missing:
+        # DO NOTHING keeps this safe if another ingest adds the same source
+        stmt = _dialect_insert(db)(Source).on_conflict_do_nothing(
+            index_elements=["name"]
+        )
+        db.execute(stmt, [{"name": name} for name in sorted(missing)])
+        rows = db.execute(
+            select(Source.name, Source.id).where(Source.name.in_(missing))
+        )
+        name_to_id.update({name: source_id for name, source_id in rows})
+    return name_to_id
 
 
 def ingest_articles(db: Session, articles: List[Dict]) -> int:
@@ -24,36 +50,51 @@ def ingest_articles(db: Session, articles: List[Dict]) -> int:
     Insert each normalized dict into the DB if its canonical URL isn't
     already there. Handle duplicates within the same batch.
 
+    Rows go in as one multi-row INSERT ... ON CONFLICT (url) DO NOTHING,
+    so deduplication against existing articles happens in the database
+    via the unique URL index.
+
     Returns number of new rows.
     """
-    added = 0
-    seen_urls = set()  # Track URLs in current batch
+    if not articles:
+        return 0
+
+    source_ids = get_or_create_source_ids(db, {a["source_name"] for a in articles})
 
+    rows: List[Dict[str, Any]] = []
+    seen_urls = set()  # Track URLs in current batch
     for a in articles:
         url = a["url"]
-
-        # Skip if already exists in DB or already processed in this batch
-        if article_exists(db, url) or url in seen_urls:
+        if url in seen_urls:
             continue
 
-        src = get_or_create_source(db, a["source_name"])
-        db.add(
-            Article(
-                title=a["title"],
-                description=a["description"],
-                url=url,
-                image_url=a["image_url"],
-                published_at=a["published_at"],
-                language=a["language"],
-                country=a["country"],
-                category=a["category"],
-                sentiment_label=a["sentiment_label"],
-                sentiment_score=a["sentiment_score"],
-                source_id=src.id,
-            )
+        rows.append(
+            {
+                "title": a["title"],
+                "description": a["description"],
+                "url": url,
+                "image_url": a["image_url"],
+                "published_at": a["published_at"],
+                "language": a["language"],
+                "country": a["country"],
+                "category": a["category"],
+                "sentiment_label": a["sentiment_label"],
+                "sentiment_score": a["sentiment_score"],
+                "source_id": source_ids[a["source_name"]],
+            }
         )
         seen_urls.add(url)
-        added += 1
 
+    stmt = (
+        _dialect_insert(db)(Article)
+        .values(rows)
+        .on_conflict_do_nothing(index_elements=["url"])
+    )
+    result: CursorResult = db.execute(stmt)
     db.commit()
-    return added
+
+    inserted = result.rowcount
+    if inserted:
+        # Cached API feeds no longer reflect the latest articles
+        invalidate_article_cache()
+    return inserted
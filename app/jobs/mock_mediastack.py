@@ -1,5 +1,6 @@
 """Mock data for local development when Mediastack API is unavailable."""
 
+import logging
 from typing import Dict, List
 
 # Sample mock articles matching Mediastack API response format
@@ -78,5 +79,5 @@ def get_mock_articles_for_source(source_name: str) -> List[Dict]:
 
 def fetch_mock_articles_from_source(source: str) -> List[Dict]:
     """Mock version of fetch_articles_from_source for local development."""
-    print(f"→ Using MOCK data for {source} (Mediastack API unavailable)")
+    logging.debug("→ Using MOCK data for %s (Mediastack API unavailable)", source)
     return get_mock_articles_for_source(source)
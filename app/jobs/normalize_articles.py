@@ -1,14 +1,66 @@
-from typing import Dict, List
+import re
+from datetime import datetime
+from typing import Dict, List, Optional
 from urllib.parse import urlparse, urlunparse
 
 from dateutil import parser
 
-from app.utils.sentiment import analyze_sentiment
+from app.utils.sentiment import analyze_sentiment_batch
+
+# Plain lowercase http(s) URL: ASCII netloc and a path free of whitespace and
+# control characters, up to the query string / fragment (which are dropped)
+_SIMPLE_HTTP_URL = re.compile(
+    r"(https?://[^\x00-\x20\x7f-\U0010ffff/?#;\[\]]+)"
+    r"(/[^\x00-\x20\x7f?#]*)?"
+    r"(?:[?#].*)?",
+    re.DOTALL,
+)
+
+
+def canonicalize_url(raw_url: str) -> str:
+    """
+    Drop the query, fragment and last-segment ;params from a URL.
+
+    Common http(s) URLs are handled with one regex match; anything else
+    (upper-case schemes, whitespace, IPv6 hosts, ...) goes through urlparse /
+    urlunparse so the dedup key always matches the rebuilt URL exactly.
+    """
+    match = _SIMPLE_HTTP_URL.fullmatch(raw_url)
+    if match is None:
+        p = urlparse(raw_url)
+        return urlunparse((p.scheme, p.netloc, p.path, "", "", ""))
+
+    base, path = match.group(1), match.group(2) or ""
+    head, sep, last_segment = path.rpartition("/")
+    if ";" in last_segment:
+        path = head + sep + last_segment.partition(";")[0]
+    return base + path
+
+
+def parse_published_at(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse an article timestamp, or None if missing or unparseable.
+
+    Mediastack sends ISO 8601 ("2025-11-18T10:00:00+00:00"), which the
+    C-implemented datetime.fromisoformat handles directly (including a
+    trailing "Z" on Python 3.11+); dateutil only covers the odd cases.
+    """
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    try:
+        return parser.isoparse(value)
+    except Exception:
+        return None
 
 
 def normalize_articles(raw: List[Dict]) -> List[Dict]:
     seen = set()
     out = []
+    texts = []
     for item in raw:
         title = item.get("title", "").strip()
         desc = item.get("description", "").strip()
@@ -17,8 +69,7 @@ def normalize_articles(raw: List[Dict]) -> List[Dict]:
             continue
 
         # canonical URL: drop query & fragment
-        p = urlparse(orig_url)
-        canon = urlunparse((p.scheme, p.netloc, p.path, "", "", ""))
+        canon = canonicalize_url(orig_url)
 
         key = (canon, item["source_name"])
         if key in seen:
@@ -26,13 +77,10 @@ def normalize_articles(raw: List[Dict]) -> List[Dict]:
         seen.add(key)
 
         # parse date
-        try:
-            published = parser.isoparse(item["published_at"])
-        except Exception:
-            published = None
+        published = parse_published_at(item.get("published_at"))
 
-        # sentiment
-        label, score = analyze_sentiment(f"{title} {desc}")
+        # sentiment is scored for the whole batch below
+        texts.append(f"{title} {desc}")
 
         out.append(
             {
@@ -45,8 +93,11 @@ def normalize_articles(raw: List[Dict]) -> List[Dict]:
                 "language": item.get("language"),
                 "country": item.get("country"),
                 "category": item.get("category"),
-                "sentiment_label": label,
-                "sentiment_score": score,
             }
         )
+
+    # One batch call lets the provider dedupe and parallelise the work
+    for article, (label, score) in zip(out, analyze_sentiment_batch(texts)):
+        article["sentiment_label"] = label
+        article["sentiment_score"] = score
     return out
@@ -1,4 +1,17 @@
-import subprocess
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+
+# Repository root, where alembic.ini and the alembic/ scripts live
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _alembic_config() -> Config:
+    """Build the Alembic config so migrations run in-process from any CWD."""
+    cfg = Config(str(PROJECT_ROOT / "alembic.ini"))
+    cfg.set_main_option("script_location", str(PROJECT_ROOT / "alembic"))
+    return cfg
 
 
 def reset_database() -> None:
@@ -6,10 +19,11 @@ def reset_database() -> None:
     WARNING: This will drop ALL tables in your configured database and
     recreate them via Alembic migrations.
     """
+    cfg = _alembic_config()
     print("⚠️ Dropping all tables...")
-    subprocess.run(["alembic", "downgrade", "base"], check=True)
+    command.downgrade(cfg, "base")
     print("🆕 Recreating schema via Alembic migrations...")
-    subprocess.run(["alembic", "upgrade", "head"], check=True)
+    command.upgrade(cfg, "head")
     print("✅ Database reset complete.")
 
 
@@ -3,7 +3,7 @@ import sys
 
 from app.database import SessionLocal
 from app.jobs.crawl_worker import run_crawl_worker
-from app.jobs.fetch_from_mediastack import fetch_all_sources
+from app.jobs.fetch_from_mediastack import iter_source_batches
 from app.jobs.ingest_articles import ingest_articles
 from app.jobs.normalize_articles import normalize_articles
 
@@ -22,22 +22,21 @@ def run_ingestion(include_crawling: bool = True, max_crawl_jobs: int = 5) -> Non
     """
     logging.info("\n🚀 Starting ingestion pipeline…")
 
-    # Step 1: Fetch articles from Mediastack
-    logging.info("📡 Fetching articles from Mediastack...")
-    raw = fetch_all_sources()
-
-    # Step 2: Normalize article data
-    logging.info("🔄 Normalizing article data...")
-    norm = normalize_articles(raw)
-
-    # Step 3: Ingest articles into database
-    logging.info("💾 Ingesting articles into database...")
+    # Steps 1-3: Fetch, normalize and ingest one source at a time, as each
+    # Mediastack fetch completes, so only one source batch is held at once
+    logging.info("📡 Fetching, normalizing and ingesting articles per source...")
+    fetched = 0
+    new = 0
     db = SessionLocal()
     try:
-        new = ingest_articles(db, norm)
-        logging.info("✅ Ingested %d new articles", new)
+        for src, raw in iter_source_batches():
+            added = ingest_articles(db, normalize_articles(raw))
+            logging.info("→ %s: %d fetched, %d new", src, len(raw), added)
+            fetched += len(raw)
+            new += added
     finally:
         db.close()
+    logging.info("✅ Fetched %d raw articles, ingested %d new articles", fetched, new)
 
     # Step 4: Run crawl worker (if enabled)
     if include_crawling:
@@ -71,10 +70,15 @@ if __name__ == "__main__":
     include_crawling = True
     max_crawl_jobs = 5
 
-    if len(sys.argv) > 1:
-        if sys.argv[1] == "--no-crawl":
+    # -v/--verbose enables per-article DEBUG logging
+    args = [arg for arg in sys.argv[1:] if arg not in ("-v", "--verbose")]
+    if len(args) < len(sys.argv) - 1:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+    if args:
+        if args[0] == "--no-crawl":
             include_crawling = False
-        elif sys.argv[1] == "--crawl-only":
+        elif args[0] == "--crawl-only":
             # Skip ingestion, just run crawl worker
             logging.info("🕷️ Running crawl worker only...")
             result = run_crawl_worker(max_jobs=max_crawl_jobs)
@@ -84,7 +88,7 @@ if __name__ == "__main__":
                 result["failed"],
             )
             sys.exit(0)
-        elif sys.argv[1].startswith("--max-crawl="):
-            max_crawl_jobs = int(sys.argv[1].split("=")[1])
+        elif args[0].startswith("--max-crawl="):
+            max_crawl_jobs = int(args[0].split("=")[1])
 
     run_ingestion(include_crawling=include_crawling, max_crawl_jobs=max_crawl_jobs)
@@ -8,7 +8,7 @@ Should be run periodically (e.g., hourly via cron or task scheduler).
 import logging
 from datetime import datetime, timezone
 
-from sqlalchemy import func
+from sqlalchemy import CursorResult, delete, func, select
 from sqlalchemy.orm import Session
 
 from app.database import SessionLocal
@@ -19,14 +19,36 @@ from app.utils.ttl import get_ttl_info
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Rows deleted per transaction, so a large expired backlog doesn't hold
+# locks or bloat the WAL in one huge DELETE
+CLEANUP_BATCH_SIZE = 10_000
 
-def cleanup_expired_content(db: Session | None = None) -> dict:
+
+def cleanup_expired_content(
+    db: Session | None = None,
+    batch_size: int = CLEANUP_BATCH_SIZE,
+    now: datetime | None = None,
+) -> dict:
     """
     Remove expired article content based on expires_at TTL.
 
+    Deletes in batches of at most batch_size rows, committing after each,
+    so a failure only rolls back the current batch.
+
+    Args:
+        db: Database session (a new one is opened and closed if omitted)
+        batch_size: Maximum rows deleted per transaction
+        now: Reference UTC timestamp (defaults to the current time)
+
     Returns:
         dict: Cleanup statistics including count of deleted records
+
+    Raises:
+        ValueError: If batch_size is not positive
     """
+    if batch_size <= 0:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+
     if db is None:
         db = SessionLocal()
         should_close = True
@@ -34,38 +56,43 @@ def cleanup_expired_content(db: Session | None = None) -> dict:
         should_close = False
 
     try:
-        now = datetime.now(timezone.utc)
-
-        # Find expired content
-        expired_query = db.query(ArticleContent).filter(
-            ArticleContent.expires_at <= now
+        if now is None:
+            now = datetime.now(timezone.utc)
+
+        # Bulk DELETEs by id batch (served by ix_article_contents_expires_at);
+        # expired rows are never loaded into the session
+        expired_ids = (
+            select(ArticleContent.id)
+            .where(ArticleContent.expires_at <= now)
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        stmt = (
+            delete(ArticleContent)
+            .where(ArticleContent.id.in_(expired_ids))
+            .execution_options(synchronize_session=False)
         )
 
-        expired_count = expired_query.count()
-
-        if expired_count > 0:
-            logger.info(f"Found {expired_count} expired article contents to cleanup")
-
-            # Delete expired content
-            deleted_count = expired_query.delete(synchronize_session=False)
+        deleted_count = 0
+        while True:
+            result: CursorResult = db.execute(stmt)
             db.commit()
+            deleted_count += result.rowcount
+            if result.rowcount < batch_size:
+                break
 
+        if deleted_count > 0:
             logger.info(
                 f"Successfully cleaned up {deleted_count} expired article contents"
             )
-
-            return {
-                "status": "success",
-                "deleted_count": deleted_count,
-                "cleanup_time": now.isoformat(),
-            }
         else:
             logger.info("No expired article contents found")
-            return {
-                "status": "success",
-                "deleted_count": 0,
-                "cleanup_time": now.isoformat(),
-            }
+
+        return {
+            "status": "success",
+            "deleted_count": deleted_count,
+            "cleanup_time": now.isoformat(),
+        }
 
     except Exception as e:
         db.rollback()
@@ -82,10 +109,16 @@ def cleanup_expired_content(db: Session | None = None) -> dict:
             db.close()
 
 
-def get_content_statistics(db: Session | None = None) -> dict:
+def get_content_statistics(
+    db: Session | None = None, now: datetime | None = None
+) -> dict:
     """
     Get statistics about article content storage for monitoring.
 
+    Args:
+        db: Database session (a new one is opened and closed if omitted)
+        now: Reference UTC timestamp (defaults to the current time)
+
     Returns:
         dict: Statistics including total, expired, and space usage
     """
@@ -96,22 +129,22 @@ def get_content_statistics(db: Session | None = None) -> dict:
         should_close = False
 
     try:
-        now = datetime.now(timezone.utc)
-
-        # Total content records
-        total_count = db.query(ArticleContent).count()
-
-        # Expired but not yet cleaned up
-        expired_count = (
-            db.query(ArticleContent).filter(ArticleContent.expires_at <= now).count()
-        )
+        if now is None:
+            now = datetime.now(timezone.utc)
+
+        # Total, expired-but-not-yet-cleaned and average length in one query
+        total_count, expired_count, avg_length = db.execute(
+            select(
+                func.count(),
+                func.count().filter(ArticleContent.expires_at <= now),
+                func.avg(ArticleContent.content_length),
+            ).select_from(ArticleContent)
+        ).one()
+        avg_length = avg_length or 0
 
         # Active content (not expired)
         active_count = total_count - expired_count
 
-        # Average content length
-        avg_length = db.query(func.avg(ArticleContent.content_length)).scalar() or 0
-
         return {
             "total_records": total_count,
             "active_records": active_count,
@@ -1,5 +1,5 @@
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import deferred, relationship
 
 from app.database import Base
 from app.models.source import Source  # noqa: F401
@@ -13,9 +13,10 @@ class Article(Base):
         Integer, ForeignKey("sources.id", ondelete="CASCADE"), nullable=False
     )
     title = Column(String(255), nullable=False)
-    description = Column(String(1000), nullable=True)
+    # Wide display-only columns are deferred; API queries undefer them
+    description = deferred(Column(String(1000), nullable=True))
     url = Column(String(1000), unique=True, nullable=False)
-    image_url = Column(String(1000), nullable=True)
+    image_url = deferred(Column(String(1000), nullable=True))
     published_at = Column(DateTime(timezone=True), nullable=False, index=True)
     language = Column(String(2), nullable=True)
     country = Column(String(2), nullable=True)
@@ -23,17 +24,27 @@ class Article(Base):
     sentiment_label = Column(String(20), nullable=True)
     sentiment_score = Column(Float, nullable=True)
 
+    __table_args__ = (
+        # Serves source_id joins/cascades and title-within-source lookups;
+        # url already has a unique index for URL dedup
+        Index("ix_articles_source_id_title", "source_id", "title"),
+    )
+
     source = relationship("Source", back_populates="articles")
+    # Child FKs are ON DELETE CASCADE, so deletes leave unloaded children to
+    # the database instead of SELECTing and deleting them one by one
     bookmarks = relationship(
         "Bookmark",
         back_populates="article",
         cascade="all, delete-orphan",
+        passive_deletes=True,
         lazy="select",
     )
     crawl_jobs = relationship(
         "CrawlJob",
         back_populates="article",
         cascade="all, delete-orphan",
+        passive_deletes=True,
         lazy="select",
     )
     content = relationship(
@@ -41,11 +52,13 @@ class Article(Base):
         back_populates="article",
         uselist=False,
         cascade="all, delete-orphan",
+        passive_deletes=True,
         lazy="select",
     )
     sentiment_analyses = relationship(
         "SentimentAnalysis",
         back_populates="article",
         cascade="all, delete-orphan",
+        passive_deletes=True,
         lazy="select",
     )
@@ -12,6 +12,7 @@ from sqlalchemy import (
     String,
     Text,
     func,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -30,6 +31,10 @@ class CrawlStatus(enum.Enum):
     RATE_LIMITED = "RATE_LIMITED"
 
 
+# Statuses that will never be picked up again; see cleanup_old_crawl_jobs
+_TERMINAL_STATUS_CLAUSE = text("status IN ('SUCCESS', 'FAILED', 'FORBIDDEN_BY_ROBOTS')")
+
+
 class CrawlJob(Base):
     __tablename__ = "crawl_jobs"
 
@@ -56,4 +61,11 @@ class CrawlJob(Base):
         Index("ix_crawl_jobs_status", "status"),
         Index("ix_crawl_jobs_article_id", "article_id"),
         Index("ix_crawl_jobs_created_at", "created_at"),
+        # Partial index covering only finished jobs for cleanup_old_crawl_jobs
+        Index(
+            "ix_crawl_jobs_cleanup",
+            "created_at",
+            postgresql_where=_TERMINAL_STATUS_CLAUSE,
+            sqlite_where=_TERMINAL_STATUS_CLAUSE,
+        ),
     )
@@ -1,45 +1,94 @@
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, HTTPException, Response
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session, joinedload, undefer
 
 from app.database import get_db
 from app.models.article import Article as ArticleModel
 from app.schemas.article import ArticleRead
+from app.utils.article_cache import get_cached_response, set_cached_response
 
 router = APIRouter(tags=["Articles"])
 
+_article_adapter = TypeAdapter(ArticleRead)
+_article_list_adapter = TypeAdapter(List[ArticleRead])
 
-@router.get("/", response_model=List[ArticleRead])
-def get_articles(db: Session = Depends(get_db), limit: int = 20) -> List[ArticleRead]:
-    articles = (
-        db.query(ArticleModel)
-        .order_by(ArticleModel.published_at.desc())
-        .limit(limit)
-        .all()
+
+# Article columns deferred by the model but needed for ArticleRead
+_ARTICLE_READ_OPTIONS = (
+    undefer(ArticleModel.description),
+    undefer(ArticleModel.image_url),
+)
+
+
+def _json_response(body: bytes) -> Response:
+    return Response(content=body, media_type="application/json")
+
+
+def _serialize_article(article: ArticleModel) -> bytes:
+    """Dump one ORM article to JSON without re-validating trusted DB data."""
+    return _article_adapter.dump_json(ArticleRead.from_orm_fast(article))
+
+
+def _serialize_articles(articles: List[ArticleModel]) -> bytes:
+    """Dump ORM articles to JSON without re-validating trusted DB data."""
+    return _article_list_adapter.dump_json(
+        [ArticleRead.from_orm_fast(article) for article in articles]
     )
-    return articles  # type: ignore[return-value,no-any-return]
+
+
+@router.get("/", response_model=List[ArticleRead])
+def get_articles(db: Session = Depends(get_db), limit: int = 20) -> Response:
+    cache_key = ("feed", limit)
+    body = get_cached_response(cache_key)
+    if body is None:
+        articles = (
+            db.query(ArticleModel)
+            .options(*_ARTICLE_READ_OPTIONS, joinedload(ArticleModel.source))
+            .order_by(ArticleModel.published_at.desc())
+            .limit(limit)
+            .all()
+        )
+        body = _serialize_articles(articles)
+        set_cached_response(cache_key, body)
+    return _json_response(body)
 
 
 @router.get("/latest", response_model=List[ArticleRead])
-def get_latest_articles(
-    db: Session = Depends(get_db), limit: int = 40
-) -> List[ArticleRead]:
-    articles = (
-        db.query(ArticleModel)
-        .options(
-            joinedload(ArticleModel.source), joinedload(ArticleModel.sentiment_analyses)
+def get_latest_articles(db: Session = Depends(get_db), limit: int = 40) -> Response:
+    cache_key = ("latest", limit)
+    body = get_cached_response(cache_key)
+    if body is None:
+        articles = (
+            db.query(ArticleModel)
+            .options(
+                *_ARTICLE_READ_OPTIONS,
+                joinedload(ArticleModel.source),
+                joinedload(ArticleModel.sentiment_analyses),
+            )
+            .order_by(ArticleModel.published_at.desc())
+            .limit(limit)
+            .all()
         )
-        .order_by(ArticleModel.published_at.desc())
-        .limit(limit)
-        .all()
-    )
-    return articles  # type: ignore[return-value,no-any-return]
+        body = _serialize_articles(articles)
+        set_cached_response(cache_key, body)
+    return _json_response(body)
 
 
 @router.get("/{article_id}", response_model=ArticleRead)
-def get_article(article_id: int, db: Session = Depends(get_db)) -> ArticleRead:
-    article = db.query(ArticleModel).filter_by(id=article_id).first()
-    if not article:
-        raise HTTPException(status_code=404, detail="Article not found")
-    return article  # type: ignore[return-value,no-any-return]
+def get_article(article_id: int, db: Session = Depends(get_db)) -> Response:
+    cache_key = ("article", article_id)
+    body = get_cached_response(cache_key)
+    if body is None:
+        article = (
+            db.query(ArticleModel)
+            .options(*_ARTICLE_READ_OPTIONS)
+            .filter_by(id=article_id)
+            .first()
+        )
+        if not article:
+            raise HTTPException(status_code=404, detail="Article not found")
+        body = _serialize_article(article)
+        set_cached_response(cache_key, body)
+    return _json_response(body)
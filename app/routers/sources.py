@@ -1,6 +1,7 @@
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import literal, select
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -12,8 +13,9 @@ router = APIRouter(tags=["Sources"])
 
 @router.post("/", response_model=SourceRead)
 def create_source(source_in: SourceCreate, db: Session = Depends(get_db)) -> SourceRead:
-    existing = db.query(SourceModel).filter_by(name=source_in.name).first()
-    if existing:
+    # Existence check only - select a constant rather than loading the row
+    exists_stmt = select(literal(1)).where(SourceModel.name == source_in.name)
+    if db.execute(exists_stmt).first() is not None:
         raise HTTPException(400, "Source already exists")
     src = SourceModel(name=source_in.name)
     db.add(src)
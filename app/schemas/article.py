@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Literal, Optional
+from typing import Any, Literal, Optional
 
 from pydantic import BaseModel, Field, HttpUrl, field_validator
 
@@ -59,6 +59,11 @@ class SourceInArticle(BaseModel):
         "from_attributes": True,
     }
 
+    @classmethod
+    def from_orm_fast(cls, obj: Any) -> "SourceInArticle":
+        """Build from a trusted ORM row, skipping validation."""
+        return cls.model_construct(id=obj.id, name=obj.name)
+
 
 class ArticleRead(ArticleBase):
     """Schema for reading article data with sentiment info."""
@@ -93,3 +98,21 @@ class ArticleRead(ArticleBase):
             }
         },
     }
+
+    @classmethod
+    def from_orm_fast(cls, obj: Any) -> "ArticleRead":
+        """
+        Build from a trusted ORM row, skipping full validation.
+
+        Only for rows loaded from our own database - never for request input.
+        Fields whose validation changes the serialized value (url
+        normalization, title stripping) are still coerced so the output
+        matches the validated model.
+        """
+        values = {
+            name: getattr(obj, name) for name in cls.model_fields if name != "source"
+        }
+        values["title"] = obj.title.strip()
+        values["url"] = HttpUrl(obj.url)
+        values["source"] = SourceInArticle.from_orm_fast(obj.source)
+        return cls.model_construct(**values)
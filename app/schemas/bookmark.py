@@ -9,10 +9,6 @@ class BookmarkCreate(BookmarkBase):
     pass
 
 
-class Bookmark(BookmarkBase):
-    id: int
-
-
 class BookmarkRead(BaseModel):
     id: int
     article_id: int
@@ -0,0 +1,48 @@
+"""In-process cache for serialized article API responses."""
+
+import threading
+from typing import Hashable, Optional
+
+from cachetools import TTLCache  # type: ignore[import-untyped]
+
+# Articles only change when ingestion or crawling runs, so a short TTL keeps
+# the feed fresh while serving repeated requests without touching the DB
+ARTICLE_CACHE_TTL_SECS = 60
+ARTICLE_CACHE_MAXSIZE = 256
+_article_cache: TTLCache = TTLCache(
+    maxsize=ARTICLE_CACHE_MAXSIZE, ttl=ARTICLE_CACHE_TTL_SECS
+)
+_article_cache_lock = threading.RLock()
+
+
+def get_cached_response(key: Hashable) -> Optional[bytes]:
+    """
+    Get a cached JSON response body.
+
+    Args:
+        key: Cache key (endpoint name plus its parameters)
+
+    Returns:
+        bytes: Serialized response, or None on a miss
+    """
+    with _article_cache_lock:
+        body: Optional[bytes] = _article_cache.get(key)
+        return body
+
+
+def set_cached_response(key: Hashable, body: bytes) -> None:
+    """
+    Store a serialized JSON response body.
+
+    Args:
+        key: Cache key (endpoint name plus its parameters)
+        body: Serialized response
+    """
+    with _article_cache_lock:
+        _article_cache[key] = body
+
+
+def invalidate_article_cache() -> None:
+    """Drop all cached article responses (e.g. after new articles are ingested)."""
+    with _article_cache_lock:
+        _article_cache.clear()
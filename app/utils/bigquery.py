@@ -6,7 +6,9 @@ to BigQuery for advanced analytics and reporting.
 """
 
 import logging
-from datetime import datetime
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 from google.cloud import bigquery  # type: ignore[import-untyped,attr-defined]
@@ -200,8 +202,10 @@ class BigQuerySentimentRepository:
             return []
 
 
-# Singleton instance
-bigquery_repo = BigQuerySentimentRepository()
+@lru_cache(maxsize=1)
+def get_bq_repo() -> BigQuerySentimentRepository:
+    """Get or create the shared BigQuery repository on first use."""
+    return BigQuerySentimentRepository()
 
 
 def stream_article_sentiment(
@@ -232,14 +236,23 @@ def stream_article_sentiment(
     Returns:
         True if successful, False otherwise
     """
+    ingested_at = time.time()
+
+    # SQLite hands back naive datetimes; like the old offset-less ISO string,
+    # treat them as UTC rather than the process's local time
+    if published_at.tzinfo is None:
+        published_at = published_at.replace(tzinfo=timezone.utc)
+
+    # TIMESTAMP columns accept epoch seconds directly, which skips the
+    # ISO-8601 string round-trip on both ends of the streaming insert.
     event_data = {
-        "event_id": f"{article_id}_{sentiment_provider}_{int(datetime.now().timestamp())}",
+        "event_id": f"{article_id}_{sentiment_provider}_{int(ingested_at)}",
         "article_id": article_id,
         "article_url": article_url,
         "article_title": article_title,
         "source_name": source_name,
-        "published_at": published_at.isoformat(),
-        "ingested_at": datetime.utcnow().isoformat(),
+        "published_at": published_at.timestamp(),
+        "ingested_at": ingested_at,
         "sentiment_provider": sentiment_provider,
         "sentiment_model": kwargs.get("model_name", "vader_lexicon"),
         "sentiment_score": sentiment_score,
@@ -254,4 +267,4 @@ def stream_article_sentiment(
         "extraction_method": kwargs.get("extraction_method", "web_crawl"),
     }
 
-    return bigquery_repo.stream_sentiment_event(event_data)
+    return get_bq_repo().stream_sentiment_event(event_data)
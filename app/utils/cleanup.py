@@ -3,7 +3,7 @@
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict
 
-from sqlalchemy import func
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from app.models.article_content import ArticleContent
@@ -23,26 +23,23 @@ def cleanup_expired_content(db: Session) -> Dict[str, Any]:
     """
     now = datetime.now(timezone.utc)
 
-    # Count expired records before deletion
-    expired_count = (
-        db.query(ArticleContent).filter(ArticleContent.expires_at <= now).count()
-    )
-
-    # Delete expired content
+    # Delete expired content; the rowcount is also the number found
     deleted = db.query(ArticleContent).filter(ArticleContent.expires_at <= now).delete()
 
     db.commit()
 
-    # Get remaining content statistics
-    total_remaining = db.query(ArticleContent).count()
-
-    # Get oldest and newest content dates
-    oldest_content = db.query(func.min(ArticleContent.extracted_at)).scalar()
-    newest_content = db.query(func.max(ArticleContent.extracted_at)).scalar()
+    # Remaining count and oldest/newest content dates in one query
+    total_remaining, oldest_content, newest_content = db.execute(
+        select(
+            func.count(),
+            func.min(ArticleContent.extracted_at),
+            func.max(ArticleContent.extracted_at),
+        ).select_from(ArticleContent)
+    ).one()
 
     return {
         "expired_content_deleted": deleted,
-        "expired_content_found": expired_count,
+        "expired_content_found": deleted,
         "total_content_remaining": total_remaining,
         "oldest_content_date": oldest_content.isoformat() if oldest_content else None,
         "newest_content_date": newest_content.isoformat() if newest_content else None,
@@ -63,20 +60,13 @@ def cleanup_old_crawl_jobs(db: Session, days_old: int = 7) -> Dict[str, Any]:
     """
     cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_old)
 
-    # Count old records
     terminal_statuses = [
         CrawlStatus.SUCCESS,
         CrawlStatus.FAILED,
         CrawlStatus.FORBIDDEN_BY_ROBOTS,
     ]
-    old_count = (
-        db.query(CrawlJob)
-        .filter(CrawlJob.created_at < cutoff_date)
-        .filter(CrawlJob.status.in_(terminal_statuses))  # type: ignore[attr-defined]
-        .count()
-    )
 
-    # Delete old completed/failed crawl jobs
+    # Delete old completed/failed crawl jobs; the rowcount is also the number found
     deleted = (
         db.query(CrawlJob)
         .filter(CrawlJob.created_at < cutoff_date)
@@ -88,7 +78,7 @@ def cleanup_old_crawl_jobs(db: Session, days_old: int = 7) -> Dict[str, Any]:
 
     return {
         "old_crawl_jobs_deleted": deleted,
-        "old_crawl_jobs_found": old_count,
+        "old_crawl_jobs_found": deleted,
         "cutoff_date": cutoff_date.isoformat(),
     }
 
@@ -106,14 +96,23 @@ def get_database_stats(db: Session) -> Dict[str, Any]:
     from app.models.article import Article
     from app.models.source import Source
 
-    # Get table counts
-    stats: Dict[str, Any] = {
-        "sources_count": db.query(Source).count(),
-        "articles_count": db.query(Article).count(),
-        "article_contents_count": db.query(ArticleContent).count(),
-        "crawl_jobs_count": db.query(CrawlJob).count(),
-        "sentiment_analyses_count": db.query(SentimentAnalysis).count(),
+    # Get table counts in one round-trip, one scalar subquery per table
+    count_keys = {
+        "sources_count": Source,
+        "articles_count": Article,
+        "article_contents_count": ArticleContent,
+        "crawl_jobs_count": CrawlJob,
+        "sentiment_analyses_count": SentimentAnalysis,
     }
+    counts = db.execute(
+        select(
+            *(
+                select(func.count()).select_from(model).scalar_subquery()
+                for model in count_keys.values()
+            )
+        )
+    ).one()
+    stats: Dict[str, Any] = dict(zip(count_keys, counts))
 
     # Get crawl job status breakdown
     crawl_status_stats = (
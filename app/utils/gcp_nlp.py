@@ -6,7 +6,12 @@ Google Cloud Natural Language API with proper error handling, rate limiting,
 and abstraction that matches the existing sentiment provider interface.
 """
 
+import asyncio
 import logging
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional, Tuple
 
 from google.api_core import exceptions as gcp_exceptions  # type: ignore[import-untyped]
@@ -16,6 +21,12 @@ from app.config import config
 
 logger = logging.getLogger(__name__)
 
+# Exponential backoff (with jitter) for quota errors in the async batch path
+QUOTA_RETRY_ATTEMPTS = 3
+QUOTA_BACKOFF_BASE = 0.5
+QUOTA_BACKOFF_CAP = 8.0
+QUOTA_BACKOFF_JITTER = 0.25
+
 
 class GcpNlpClient:
     """
@@ -40,21 +51,31 @@ class GcpNlpClient:
             or os.getenv("GOOGLE_CLOUD_PROJECT")
         )
         self._client: Optional[language_v1.LanguageServiceClient] = None
+        self._client_lock = threading.Lock()
 
         # Sentiment score mapping thresholds (from configuration)
         self.positive_threshold = config.sentiment.gcp_nl_positive_threshold
         self.negative_threshold = config.sentiment.gcp_nl_negative_threshold
+        self._max_length = config.sentiment.gcp_nl_max_text_length
+
+        # Batch concurrency and in-flight request cap (respects API quota)
+        self.batch_concurrency = max(1, config.sentiment.gcp_nl_batch_concurrency)
+        self._in_flight = threading.BoundedSemaphore(
+            max(1, config.sentiment.gcp_nl_max_in_flight)
+        )
 
     @property
     def client(self) -> language_v1.LanguageServiceClient:
-        """Lazy initialization of GCP Natural Language client."""
+        """Lazy, thread-safe initialization of GCP Natural Language client."""
         if self._client is None:
-            try:
-                self._client = language_v1.LanguageServiceClient()
-                logger.info("Initialized Google Cloud Natural Language client")
-            except Exception as e:
-                logger.error(f"Failed to initialize GCP NL client: {e}")
-                raise
+            with self._client_lock:
+                if self._client is None:
+                    try:
+                        self._client = language_v1.LanguageServiceClient()
+                        logger.info("Initialized Google Cloud Natural Language client")
+                    except Exception as e:
+                        logger.error(f"Failed to initialize GCP NL client: {e}")
+                        raise
         return self._client
 
     def analyze_sentiment(self, text: str) -> Tuple[str, float, Optional[float]]:
@@ -75,15 +96,25 @@ class GcpNlpClient:
         Raises:
             Exception: If API call fails after retries
         """
-        if not text or not text.strip():
+        return self._analyze_sentiment(text, raise_on_quota=False)
+
+    def _analyze_sentiment(
+        self, text: str, raise_on_quota: bool
+    ) -> Tuple[str, float, Optional[float]]:
+        """Run a single sentiment request, optionally re-raising quota errors."""
+        if not text or text.isspace():
             logger.warning("Empty text provided for sentiment analysis")
             return "neutral", 0.0, None
 
         # Truncate text if too long (GCP NL has limits)
-        max_length = config.sentiment.gcp_nl_max_text_length
-        if len(text.encode("utf-8")) > max_length:
-            logger.warning(f"Text too long ({len(text)} chars), truncating")
-            text = text[: max_length // 4]  # Conservative truncation
+        max_length = self._max_length
+        # len(text) * 4 bounds the UTF-8 size, so only encode when it could exceed
+        if len(text) * 4 > max_length:
+            encoded = text.encode("utf-8")
+            if len(encoded) > max_length:
+                logger.warning(f"Text too long ({len(encoded)} bytes), truncating")
+                # Cut at the byte limit, dropping any split trailing character
+                text = encoded[:max_length].decode("utf-8", "ignore")
 
         try:
             # Create document object - hardcode English
@@ -95,12 +126,13 @@ class GcpNlpClient:
             )
 
             # Call the API (following official GCP NL documentation)
-            response = self.client.analyze_sentiment(
-                request={
-                    "document": document,
-                    "encoding_type": language_v1.EncodingType.UTF8,
-                }
-            )
+            with self._in_flight:
+                response = self.client.analyze_sentiment(
+                    request={
+                        "document": document,
+                        "encoding_type": language_v1.EncodingType.UTF8,
+                    }
+                )
 
             sentiment = response.document_sentiment
             score = float(sentiment.score)
@@ -114,11 +146,13 @@ class GcpNlpClient:
             else:
                 label = "neutral"
 
-            debug_msg = (
-                f"GCP NL sentiment: score={score:.3f}, "
-                f"magnitude={magnitude:.3f}, label={label}"
+            # %-style args are only formatted if DEBUG is actually enabled
+            logger.debug(
+                "GCP NL sentiment: score=%.3f, magnitude=%.3f, label=%s",
+                score,
+                magnitude,
+                label,
             )
-            logger.debug(debug_msg)
 
             return label, score, magnitude
 
@@ -127,6 +161,8 @@ class GcpNlpClient:
             return "neutral", 0.0, None
 
         except gcp_exceptions.ResourceExhausted as e:
+            if raise_on_quota:
+                raise
             logger.error(f"GCP NL API quota exceeded: {e}")
             # Fall back to neutral sentiment when quota exceeded
             return "neutral", 0.0, None
@@ -144,24 +180,83 @@ class GcpNlpClient:
         self, texts: list[str]
     ) -> list[Tuple[str, float, Optional[float]]]:
         """
-        Analyze sentiment for multiple texts in batch (future enhancement).
+        Analyze sentiment for multiple texts concurrently.
+
+        GCP NL has no batch sentiment endpoint, but each call is IO-bound,
+        so requests are fanned out over a thread pool sharing one client.
 
         Args:
             texts: List of texts to analyze (English only)
 
         Returns:
-            List of sentiment tuples (label, score, magnitude)
+            List of sentiment tuples (label, score, magnitude), in input order
+        """
+        if not texts:
+            return []
+
+        workers = min(self.batch_concurrency, len(texts))
+        if workers == 1:
+            return [self.analyze_sentiment(text) for text in texts]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.analyze_sentiment, texts))
+
+    async def analyze_sentiment_batch_async(
+        self, texts: list[str]
+    ) -> list[Tuple[str, float, Optional[float]]]:
         """
-        # For now, process individually (could be optimized with batch API)
-        results = []
-        for text in texts:
-            result = self.analyze_sentiment(text)
-            results.append(result)
-        return results
+        Async variant of analyze_sentiment_batch for event-loop callers.
 
+        Requests run in the default executor, bounded by an asyncio.Semaphore
+        sized from gcp_nl_batch_concurrency. Quota errors are retried with
+        exponential backoff and jitter using asyncio.sleep, so the event loop
+        is never blocked.
+
+        Args:
+            texts: List of texts to analyze (English only)
 
-# Singleton instance for dependency injection
-gcp_nlp_client = GcpNlpClient()
+        Returns:
+            List of sentiment tuples (label, score, magnitude), in input order
+        """
+        semaphore = asyncio.Semaphore(self.batch_concurrency)
+        results = await asyncio.gather(
+            *(self._analyze_sentiment_async(text, semaphore) for text in texts),
+            return_exceptions=True,
+        )
+
+        output: list[Tuple[str, float, Optional[float]]] = []
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.error(f"Unexpected error in GCP NL batch analysis: {result}")
+                output.append(("neutral", 0.0, None))
+            else:
+                output.append(result)
+        return output
+
+    async def _analyze_sentiment_async(
+        self, text: str, semaphore: asyncio.Semaphore
+    ) -> Tuple[str, float, Optional[float]]:
+        """Analyze one text in the executor, backing off on quota errors."""
+        loop = asyncio.get_running_loop()
+        async with semaphore:
+            for attempt in range(QUOTA_RETRY_ATTEMPTS + 1):
+                try:
+                    return await loop.run_in_executor(
+                        None, self._analyze_sentiment, text, True
+                    )
+                except gcp_exceptions.ResourceExhausted as e:
+                    if attempt == QUOTA_RETRY_ATTEMPTS:
+                        logger.error(f"GCP NL API quota exceeded: {e}")
+                        break
+                    delay = min(QUOTA_BACKOFF_CAP, QUOTA_BACKOFF_BASE * 2**attempt)
+                    await asyncio.sleep(delay + random.random() * QUOTA_BACKOFF_JITTER)
+        return "neutral", 0.0, None
+
+
+@lru_cache(maxsize=1)
+def get_gcp_nlp_client() -> GcpNlpClient:
+    """Get or create the shared GCP NL client on first use."""
+    return GcpNlpClient()
 
 
 def analyze_sentiment_gcp(text: str) -> Tuple[str, float]:
@@ -174,5 +269,5 @@ def analyze_sentiment_gcp(text: str) -> Tuple[str, float]:
     Returns:
         Tuple of (label, score) - magnitude is dropped to match VADER interface
     """
-    label, score, _ = gcp_nlp_client.analyze_sentiment(text)
+    label, score, _ = get_gcp_nlp_client().analyze_sentiment(text)
     return label, score
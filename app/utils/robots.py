@@ -9,24 +9,56 @@ This module ensures we respect website crawling policies by:
 """
 
 import logging
-import os
-import tempfile
-from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Optional, Tuple
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from urllib.parse import urlparse
 from urllib.robotparser import RobotFileParser
 
 import requests
+from cachetools import TTLCache  # type: ignore[import-untyped]
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from app.utils.robots_store import load_robots_body, save_robots_body
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Cache TTL for robots.txt in seconds (24 hours)
+ROBOTS_CACHE_TTL_SECS = 24 * 3600
+
+# Maximum number of domains kept in the robots.txt cache (LRU eviction)
+ROBOTS_CACHE_MAXSIZE = 4096
+
 # Global cache for robots.txt parsers (domain -> RobotFileParser)
 # In production, use Redis or similar for distributed caching
-_robots_cache: Dict[str, Tuple[RobotFileParser, datetime]] = {}
-
-# Cache TTL for robots.txt (24 hours)
-ROBOTS_CACHE_TTL = timedelta(hours=24)
+_robots_cache: TTLCache = TTLCache(
+    maxsize=ROBOTS_CACHE_MAXSIZE, ttl=ROBOTS_CACHE_TTL_SECS
+)
+_robots_lock = threading.RLock()
+
+# In-flight robots.txt fetches (domain -> Event set when the fetch finishes)
+# so concurrent lookups for a cold domain trigger a single request
+_robots_inflight: Dict[str, threading.Event] = {}
+
+# Per-request timeout (seconds, applied to connect and to read) and retry
+# policy for robots.txt fetches
+ROBOTS_FETCH_TIMEOUT = 10.0
+ROBOTS_FETCH_RETRIES = 2
+ROBOTS_RETRY_BACKOFF = 0.3
+
+# How long followers wait for an in-flight fetch (seconds): the leader's worst
+# case of every attempt timing out on connect and read, over HTTPS and then
+# the HTTP fallback, plus retry backoff. A follower that still times out
+# fetches robots.txt itself rather than assuming it is allowed.
+ROBOTS_FETCH_WAIT_TIMEOUT = 2 * (
+    (ROBOTS_FETCH_RETRIES + 1) * 2 * ROBOTS_FETCH_TIMEOUT
+    + sum(ROBOTS_RETRY_BACKOFF * 2**n for n in range(1, ROBOTS_FETCH_RETRIES + 1))
+)
 
 # Our User-Agent string (honest identification)
 USER_AGENT = (
@@ -35,6 +67,36 @@ USER_AGENT = (
 )
 
 
+def _create_session() -> requests.Session:
+    """Create a pooled HTTP session with keep-alive and retries for robots.txt."""
+    session = requests.Session()
+    session.headers.update({"User-Agent": USER_AGENT})
+    adapter = HTTPAdapter(
+        pool_connections=64,
+        pool_maxsize=128,
+        max_retries=Retry(
+            total=ROBOTS_FETCH_RETRIES,
+            backoff_factor=ROBOTS_RETRY_BACKOFF,
+            status_forcelist=(502, 503, 504),
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared session so connections are reused across domains and lookups
+_SESSION = _create_session()
+
+# Stop reading robots.txt bodies past this size (RFC 9309 allows a 500 KiB floor)
+ROBOTS_MAX_BYTES = 1024 * 1024
+
+
+# Memoize URL helpers; ingestion revisits the same hosts over and over
+URL_HELPER_CACHE_MAXSIZE = 4096
+
+
+@lru_cache(maxsize=URL_HELPER_CACHE_MAXSIZE)
 def get_domain_from_url(url: str) -> str:
     """
     Extract domain from URL for robots.txt lookup.
@@ -49,6 +111,7 @@ def get_domain_from_url(url: str) -> str:
     return parsed.netloc.lower()
 
 
+@lru_cache(maxsize=URL_HELPER_CACHE_MAXSIZE)
 def get_robots_txt_url(domain: str) -> str:
     """
     Construct robots.txt URL for a given domain.
@@ -63,6 +126,32 @@ def get_robots_txt_url(domain: str) -> str:
     return f"https://{domain}/robots.txt"
 
 
+def _read_robots_lines(response: requests.Response, domain: str) -> List[str]:
+    """
+    Read a streamed robots.txt body line by line, capped at ROBOTS_MAX_BYTES.
+
+    Args:
+        response: Response opened with stream=True
+        domain: Domain name (for logging)
+
+    Returns:
+        List[str]: Decoded lines, truncated once the size cap is reached
+    """
+    encoding = response.encoding or "utf-8"
+    lines: List[str] = []
+    total = 0
+    for raw_line in response.iter_lines(chunk_size=8192):
+        total += len(raw_line) + 1
+        if total > ROBOTS_MAX_BYTES:
+            logger.warning(
+                f"robots.txt for {domain} exceeds {ROBOTS_MAX_BYTES} bytes, "
+                "ignoring the remainder"
+            )
+            break
+        lines.append(raw_line.decode(encoding, "replace"))
+    return lines
+
+
 def fetch_robots_txt(domain: str) -> Optional[RobotFileParser]:
     """
     Fetch and parse robots.txt for a domain.
@@ -76,49 +165,28 @@ def fetch_robots_txt(domain: str) -> Optional[RobotFileParser]:
     robots_url = get_robots_txt_url(domain)
 
     try:
-        logger.debug(f"Fetching robots.txt from {robots_url}")
-
-        # Fetch with timeout and proper headers
-        response = requests.get(
-            robots_url,
-            headers={"User-Agent": USER_AGENT},
-            timeout=10,
-            allow_redirects=True,
-        )
-
-        # Handle different response codes
-        if response.status_code == 404:
-            logger.info(f"No robots.txt found for {domain} (404) - allowing all")
-            # No robots.txt means we can crawl (permissive default)
+        logger.debug("Fetching robots.txt from %s", robots_url)
+
+        # Fetch with timeout and proper headers, streaming the body
+        with _SESSION.get(
+            robots_url, timeout=ROBOTS_FETCH_TIMEOUT, allow_redirects=True, stream=True
+        ) as response:
+            # Handle different response codes
+            if response.status_code == 404:
+                logger.info(f"No robots.txt found for {domain} (404) - allowing all")
+                # No robots.txt means we can crawl (permissive default)
+                rp = RobotFileParser()
+                rp.set_url(robots_url)
+                return rp
+
+            response.raise_for_status()
+
+            # Parse robots.txt content as it streams in
             rp = RobotFileParser()
             rp.set_url(robots_url)
-            return rp
-
-        response.raise_for_status()
-
-        # Parse robots.txt content using the standard approach
-        rp = RobotFileParser()
-        rp.set_url(robots_url)
-
-        # Store content and let parser fetch it
-        # Write content to temp file and let parser read it
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".txt", delete=False
-        ) as tmp_file:
-            tmp_file.write(response.text)
-            tmp_file_path = tmp_file.name
-
-        try:
-            # Create new parser that reads from our temp file
-            temp_rp = RobotFileParser()
-            temp_rp.set_url(f"file://{tmp_file_path}")
-            temp_rp.read()
-
-            # Copy the parsed rules to our main parser
-            rp = temp_rp
-        finally:
-            # Clean up temp file
-            os.unlink(tmp_file_path)
+            lines = _read_robots_lines(response, domain)
+            rp.parse(lines)
+            save_robots_body(domain, lines)
 
         logger.info(f"Successfully parsed robots.txt for {domain}")
         return rp
@@ -130,33 +198,24 @@ def fetch_robots_txt(domain: str) -> Optional[RobotFileParser]:
         if robots_url.startswith("https://"):
             try:
                 http_url = robots_url.replace("https://", "http://")
-                logger.debug(f"Trying HTTP fallback: {http_url}")
+                logger.debug("Trying HTTP fallback: %s", http_url)
 
-                response = requests.get(
+                with _SESSION.get(
                     http_url,
-                    headers={"User-Agent": USER_AGENT},
-                    timeout=10,
+                    timeout=ROBOTS_FETCH_TIMEOUT,
                     allow_redirects=True,
-                )
-
-                if response.status_code == 200:
-                    # Use same temp file approach for HTTP fallback
-                    with tempfile.NamedTemporaryFile(
-                        mode="w", suffix=".txt", delete=False
-                    ) as tmp_file:
-                        tmp_file.write(response.text)
-                        tmp_file_path = tmp_file.name
-
-                    try:
+                    stream=True,
+                ) as response:
+                    if response.status_code == 200:
                         rp = RobotFileParser()
-                        rp.set_url(f"file://{tmp_file_path}")
-                        rp.read()
+                        rp.set_url(http_url)
+                        lines = _read_robots_lines(response, domain)
+                        rp.parse(lines)
+                        save_robots_body(domain, lines)
                         logger.info(
                             f"Successfully parsed robots.txt for {domain} via HTTP"
                         )
                         return rp
-                    finally:
-                        os.unlink(tmp_file_path)
 
             except requests.RequestException:
                 pass
@@ -180,24 +239,91 @@ def get_robots_parser(domain: str) -> Optional[RobotFileParser]:
     Returns:
         RobotFileParser or None
     """
-    now = datetime.now(timezone.utc)
-
-    # Check cache first
-    if domain in _robots_cache:
-        parser, cached_at = _robots_cache[domain]
-        if now - cached_at < ROBOTS_CACHE_TTL:
-            logger.debug(f"Using cached robots.txt for {domain}")
+    # Check cache first (expired entries are evicted by the TTLCache)
+    with _robots_lock:
+        parser: Optional[RobotFileParser] = _robots_cache.get(domain)
+        if parser is not None:
+            logger.debug("Using cached robots.txt for %s", domain)
             return parser
-        else:
-            logger.debug(f"Robots.txt cache expired for {domain}")
-            del _robots_cache[domain]
 
-    # Fetch fresh robots.txt
+        # Single-flight: only the first caller for a domain fetches
+        event = _robots_inflight.get(domain)
+        is_leader = event is None
+        if event is None:
+            event = threading.Event()
+            _robots_inflight[domain] = event
+
+    if not is_leader:
+        logger.debug("Waiting for in-flight robots.txt fetch for %s", domain)
+        if event.wait(timeout=ROBOTS_FETCH_WAIT_TIMEOUT):
+            with _robots_lock:
+                cached: Optional[RobotFileParser] = _robots_cache.get(domain)
+                return cached
+        # Never treat a stalled leader as "no robots.txt": fetch it ourselves
+        logger.warning(
+            "Timed out waiting for robots.txt fetch for %s, fetching directly",
+            domain,
+        )
+        return _load_robots_parser(domain)
+
+    # Fetch fresh robots.txt outside the lock so other domains aren't blocked
+    try:
+        return _load_robots_parser(domain)
+    finally:
+        with _robots_lock:
+            _robots_inflight.pop(domain, None)
+        event.set()
+
+
+def _load_robots_parser(domain: str) -> Optional[RobotFileParser]:
+    """
+    Load robots.txt for a domain from the store or the network and cache it.
+
+    Args:
+        domain: Domain name
+
+    Returns:
+        RobotFileParser or None if fetch fails
+    """
+    # A copy persisted by an earlier run avoids the network round-trip
+    stored_body = load_robots_body(domain, ROBOTS_CACHE_TTL_SECS)
+    if stored_body is not None:
+        logger.debug("Using stored robots.txt for %s", domain)
+        stored_parser = RobotFileParser()
+        stored_parser.set_url(get_robots_txt_url(domain))
+        stored_parser.parse(stored_body.splitlines())
+        with _robots_lock:
+            _robots_cache[domain] = stored_parser
+        return stored_parser
+
     fresh_parser = fetch_robots_txt(domain)
     if fresh_parser:
-        _robots_cache[domain] = (fresh_parser, now)
-        return fresh_parser
-    return None
+        with _robots_lock:
+            _robots_cache[domain] = fresh_parser
+    return fresh_parser
+
+
+def prewarm_robots(domains: Iterable[str], max_workers: int = 16) -> None:
+    """
+    Fetch robots.txt for many domains concurrently to warm the cache.
+
+    Lets a crawl run start with every domain's rules already cached instead
+    of fetching them one by one on each domain's first article.
+
+    Args:
+        domains: Domains that are about to be crawled (duplicates are ignored)
+        max_workers: Maximum number of concurrent robots.txt fetches
+    """
+    unique_domains = {domain for domain in domains if domain}
+    if not unique_domains:
+        return
+
+    workers = max(1, min(max_workers, len(unique_domains)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # get_robots_parser caches results and dedupes concurrent fetches
+        list(executor.map(get_robots_parser, unique_domains))
+
+    logger.info(f"Prewarmed robots.txt cache for {len(unique_domains)} domains")
 
 
 def is_url_allowed(
@@ -266,15 +392,13 @@ def get_crawl_delay(domain: str, user_agent: str = USER_AGENT) -> Optional[float
         return None
 
 
-def respect_crawl_delay(
-    domain: str, last_crawl_time: Optional[datetime] = None
-) -> bool:
+def respect_crawl_delay(domain: str, last_crawl_time: Optional[float] = None) -> bool:
     """
     Check if enough time has passed since last crawl based on robots.txt delay.
 
     Args:
         domain: Domain name
-        last_crawl_time: When we last crawled this domain
+        last_crawl_time: When we last crawled this domain (time.monotonic())
 
     Returns:
         True if we can crawl now, False if we should wait
@@ -288,8 +412,7 @@ def respect_crawl_delay(
         delay = 1.0  # Default 1 second delay for politeness
 
     # Check if enough time has passed
-    now = datetime.now(timezone.utc)
-    time_since_last = (now - last_crawl_time).total_seconds()
+    time_since_last = time.monotonic() - last_crawl_time
 
     if time_since_last >= delay:
         return True
@@ -0,0 +1,108 @@
+"""
+Persistent robots.txt store backed by SQLite.
+
+Keeps raw robots.txt bodies on local disk so a restarted worker can seed
+its in-memory robots cache instead of re-fetching every domain.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from typing import List, Optional
+
+from app.config import config
+
+logger = logging.getLogger(__name__)
+
+_CREATE_TABLE_SQL = (
+    "CREATE TABLE IF NOT EXISTS robots ("
+    "domain TEXT PRIMARY KEY, body TEXT NOT NULL, fetched_at INTEGER NOT NULL)"
+)
+
+# One process-wide connection; the lock serialises access across threads
+_connection: Optional[sqlite3.Connection] = None
+_store_lock = threading.RLock()
+_store_disabled = False
+
+
+def _get_connection() -> Optional[sqlite3.Connection]:
+    """
+    Open the store on first use.
+
+    Returns:
+        sqlite3.Connection or None if the store is disabled or unavailable
+    """
+    global _connection, _store_disabled
+    if _connection is not None or _store_disabled:
+        return _connection
+
+    path = config.crawler.crawler_robots_store_path
+    if not path:
+        _store_disabled = True
+        return None
+
+    try:
+        connection = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(_CREATE_TABLE_SQL)
+        _connection = connection
+        logger.info(f"Opened robots.txt store at {path}")
+    except sqlite3.Error as e:
+        logger.warning(f"Robots.txt store unavailable ({path}): {e}")
+        _store_disabled = True
+    return _connection
+
+
+def load_robots_body(domain: str, max_age_secs: float) -> Optional[str]:
+    """
+    Load a stored robots.txt body if it is still fresh.
+
+    Args:
+        domain: Domain name
+        max_age_secs: Maximum age of the stored copy in seconds
+
+    Returns:
+        str: robots.txt body, or None if missing, stale or unavailable
+    """
+    with _store_lock:
+        connection = _get_connection()
+        if connection is None:
+            return None
+        try:
+            row = connection.execute(
+                "SELECT body FROM robots WHERE domain = ? AND fetched_at >= ?",
+                (domain, int(time.time() - max_age_secs)),
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to read stored robots.txt for {domain}: {e}")
+            return None
+
+    if row is None:
+        return None
+    body: str = row[0]
+    return body
+
+
+def save_robots_body(domain: str, lines: List[str]) -> None:
+    """
+    Persist a freshly fetched robots.txt body.
+
+    Args:
+        domain: Domain name
+        lines: robots.txt lines as parsed
+    """
+    with _store_lock:
+        connection = _get_connection()
+        if connection is None:
+            return
+        try:
+            connection.execute(
+                "INSERT OR REPLACE INTO robots (domain, body, fetched_at) "
+                "VALUES (?, ?, ?)",
+                (domain, "\n".join(lines), int(time.time())),
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to store robots.txt for {domain}: {e}")
@@ -4,12 +4,22 @@ Google Cloud Secret Manager utilities for secure credential management.
 
 import logging
 import os
+import threading
 from typing import Optional
 
+from cachetools import TTLCache  # type: ignore[import-untyped]
 from google.cloud import secretmanager
 
 logger = logging.getLogger(__name__)
 
+# Retrieved secrets are cached briefly so hot paths don't hit Secret Manager
+SECRETS_CACHE_TTL_SECS = 300
+SECRETS_CACHE_MAXSIZE = 64
+_secrets_cache: TTLCache = TTLCache(
+    maxsize=SECRETS_CACHE_MAXSIZE, ttl=SECRETS_CACHE_TTL_SECS
+)
+_secrets_lock = threading.RLock()
+
 
 class SecretManagerClient:
     """Client for accessing Google Cloud Secret Manager."""
@@ -51,6 +61,21 @@ class SecretManagerClient:
             logger.warning("No project ID available for Secret Manager")
             return None
 
+        # Same secret names can exist in several projects
+        key = (self.project_id, secret_name, version)
+        with _secrets_lock:
+            cached: Optional[str] = _secrets_cache.get(key)
+        if cached is not None:
+            return cached
+
+        secret_value = self._access_secret(secret_name, version)
+        if secret_value is not None:
+            with _secrets_lock:
+                _secrets_cache[key] = secret_value
+        return secret_value
+
+    def _access_secret(self, secret_name: str, version: str) -> Optional[str]:
+        """Fetch a secret version from the Secret Manager API (uncached)."""
         try:
             name = (
                 f"projects/{self.project_id}/secrets/{secret_name}/versions/{version}"
@@ -1,6 +1,11 @@
+import hashlib
 import logging
-from typing import Dict, List, Optional, Tuple, Union
+import threading
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple, Union, cast
 
+from cachetools import LRUCache  # type: ignore[import-untyped]
 from vaderSentiment.vaderSentiment import (  # type: ignore[import-untyped]
     SentimentIntensityAnalyzer,
 )
@@ -9,34 +14,95 @@ from app.config import config
 
 logger = logging.getLogger(__name__)
 
-# VADER analyzer (always available as fallback)
-vader_analyzer = SentimentIntensityAnalyzer()
+
+@lru_cache(maxsize=1)
+def get_vader_analyzer() -> SentimentIntensityAnalyzer:
+    """Get or create the shared VADER analyzer (always available as fallback)."""
+    # Built on first use so importing this module doesn't parse the lexicon
+    return SentimentIntensityAnalyzer()
+
+
+# Provider and VADER label thresholds, read once from config
+# (see reload_sentiment_thresholds)
+_PROVIDER = config.sentiment.sentiment_provider.upper()
+_VADER_POS = config.sentiment.vader_positive_threshold
+_VADER_NEG = config.sentiment.vader_negative_threshold
+
+# VADER labels indexed by (score >= pos) - (score <= neg) + 1
+_VADER_LABELS = ("negative", "neutral", "positive")
+_get_compound = itemgetter("compound")
+
+# Results cache keyed by (provider, text digest) so repeated headlines are
+# not re-scored; digests avoid keeping large article texts alive
+SENTIMENT_CACHE_MAXSIZE = 20000
+_sentiment_cache: LRUCache = LRUCache(maxsize=SENTIMENT_CACHE_MAXSIZE)
+_sentiment_lock = threading.RLock()
+
+
+def reload_sentiment_thresholds() -> None:
+    """Re-read provider and VADER thresholds from config (tests or hot-reload)."""
+    global _PROVIDER, _VADER_POS, _VADER_NEG
+    _PROVIDER = config.sentiment.sentiment_provider.upper()
+    _VADER_POS = config.sentiment.vader_positive_threshold
+    _VADER_NEG = config.sentiment.vader_negative_threshold
+    # Cached labels were computed with the old thresholds
+    with _sentiment_lock:
+        _sentiment_cache.clear()
+
+
+def get_sentiment_provider() -> str:
+    """Get the provider analyze_sentiment currently dispatches to."""
+    return _PROVIDER
+
+
+def _sentiment_cache_key(provider: str, text: str) -> Tuple[str, bytes]:
+    """Build a compact cache key for a provider/text pair."""
+    digest = hashlib.blake2b(text.encode("utf-8", "ignore"), digest_size=16)
+    return provider, digest.digest()
 
 
 def analyze_sentiment_vader(text: str) -> Tuple[str, float]:
     """Analyze sentiment using VADER sentiment analyzer."""
-    if not text:
+    if not text or text.isspace():
         return "neutral", 0.0
 
-    score = vader_analyzer.polarity_scores(text)["compound"]
+    score = _get_compound(get_vader_analyzer().polarity_scores(text))
+    return _VADER_LABELS[(score >= _VADER_POS) - (score <= _VADER_NEG) + 1], score
 
-    positive_threshold = config.sentiment.vader_positive_threshold
-    negative_threshold = config.sentiment.vader_negative_threshold
 
-    if score >= positive_threshold:
-        return "positive", score
-    elif score <= negative_threshold:
-        return "negative", score
-    else:
-        return "neutral", score
+def analyze_sentiment_vader_batch(texts: List[str]) -> List[Tuple[str, float]]:
+    """
+    Analyze sentiment for many texts with VADER in a single pass.
+
+    Resolves the analyzer method and thresholds once for the whole batch
+    instead of per text, and returns results in input order.
+    """
+    polarity_scores = get_vader_analyzer().polarity_scores
+    get_compound = _get_compound
+    labels = _VADER_LABELS
+    positive_threshold = _VADER_POS
+    negative_threshold = _VADER_NEG
+
+    results: List[Tuple[str, float]] = []
+    for text in texts:
+        if not text or text.isspace():
+            results.append(("neutral", 0.0))
+            continue
+
+        score = get_compound(polarity_scores(text))
+        label = labels[
+            (score >= positive_threshold) - (score <= negative_threshold) + 1
+        ]
+        results.append((label, score))
+    return results
 
 
 def analyze_sentiment_gcp_nl(text: str) -> Tuple[str, float, Optional[float]]:
     """Analyze sentiment using Google Cloud Natural Language API (English only)."""
     try:
-        from app.utils.gcp_nlp import gcp_nlp_client
+        from app.utils.gcp_nlp import get_gcp_nlp_client
 
-        return gcp_nlp_client.analyze_sentiment(text)
+        return get_gcp_nlp_client().analyze_sentiment(text)
     except ImportError as e:
         logger.warning(f"GCP NL client not available: {e}")
         # Fall back to VADER
@@ -53,6 +119,49 @@ def analyze_sentiment_gcp_nl(text: str) -> Tuple[str, float, Optional[float]]:
             return "neutral", 0.0, None
 
 
+def analyze_sentiment_gcp_nl_batch(
+    texts: List[str],
+) -> List[Tuple[str, float, Optional[float]]]:
+    """Analyze many texts with Google Cloud Natural Language, in input order."""
+    try:
+        from app.utils.gcp_nlp import get_gcp_nlp_client
+
+        return get_gcp_nlp_client().analyze_sentiment_batch(texts)
+    except ImportError as e:
+        logger.warning(f"GCP NL client not available: {e}")
+        # Fall back to VADER
+        return [
+            (label, score, None)
+            for label, score in analyze_sentiment_vader_batch(texts)
+        ]
+    except Exception as e:
+        logger.error(f"Error in GCP NL batch sentiment analysis: {e}")
+        # Fall back to VADER
+        if config.sentiment.enable_fallback:
+            logger.info("Falling back to VADER sentiment analysis")
+            return [
+                (label, score, None)
+                for label, score in analyze_sentiment_vader_batch(texts)
+            ]
+        else:
+            return [("neutral", 0.0, None)] * len(texts)
+
+
+def _dispatch_batch(
+    provider: str, texts: List[str]
+) -> List[Tuple[Tuple[str, float], bool]]:
+    """Score texts with one provider batch call; pairs each result with cacheability."""
+    if provider == "GCP_NL":
+        # A missing magnitude means GCP NL failed or fell back - don't cache it
+        return [
+            ((label, score), magnitude is not None)
+            for label, score, magnitude in analyze_sentiment_gcp_nl_batch(texts)
+        ]
+    if provider != "VADER":
+        logger.warning(f"Unknown sentiment provider '{provider}', defaulting to VADER")
+    return [(result, True) for result in analyze_sentiment_vader_batch(texts)]
+
+
 def analyze_sentiment(text: str) -> Tuple[str, float]:
     """
     Analyze sentiment using the configured provider (English only).
@@ -69,28 +178,91 @@ def analyze_sentiment(text: str) -> Tuple[str, float]:
         This function abstracts away the provider details and returns
         a consistent interface regardless of whether VADER or GCP NL is used.
     """
-    if not text:
+    if not text or text.isspace():
         return "neutral", 0.0
 
-    provider = config.sentiment.sentiment_provider.upper()
+    provider = _PROVIDER
+
+    key = _sentiment_cache_key(provider, text)
+    with _sentiment_lock:
+        cached: Optional[Tuple[str, float]] = _sentiment_cache.get(key)
+    if cached is not None:
+        return cached
 
     if provider == "GCP_NL":
         logger.debug("Using Google Cloud Natural Language for sentiment analysis")
         label, score, magnitude = analyze_sentiment_gcp_nl(text)
-        return label, score
+        result = (label, score)
+        # A missing magnitude means GCP NL failed or fell back - don't cache it
+        if magnitude is None:
+            return result
     elif provider == "VADER":
         logger.debug("Using VADER for sentiment analysis")
-        return analyze_sentiment_vader(text)
+        result = analyze_sentiment_vader(text)
     else:
         logger.warning(f"Unknown sentiment provider '{provider}', defaulting to VADER")
-        return analyze_sentiment_vader(text)
+        result = analyze_sentiment_vader(text)
+
+    with _sentiment_lock:
+        _sentiment_cache[key] = result
+    return result
+
+
+def analyze_sentiment_batch(texts: List[str]) -> List[Tuple[str, float]]:
+    """
+    Analyze sentiment for many texts using the configured provider.
+
+    Identical texts (e.g. a headline syndicated across feeds) are scored
+    once, cached results are reused, and the remaining texts go to the
+    provider in a single batch call.
+
+    Args:
+        texts: English texts to analyze
+
+    Returns:
+        List of (sentiment_label, sentiment_score) tuples, in input order
+    """
+    results: List[Optional[Tuple[str, float]]] = [None] * len(texts)
+    positions: Dict[str, List[int]] = {}
+    for index, text in enumerate(texts):
+        if not text or text.isspace():
+            results[index] = ("neutral", 0.0)
+        else:
+            positions.setdefault(text, []).append(index)
+
+    if positions:
+        provider = _PROVIDER
+        keys = {text: _sentiment_cache_key(provider, text) for text in positions}
+
+        pending: List[str] = []
+        with _sentiment_lock:
+            for text, key in keys.items():
+                cached: Optional[Tuple[str, float]] = _sentiment_cache.get(key)
+                if cached is None:
+                    pending.append(text)
+                    continue
+                for index in positions[text]:
+                    results[index] = cached
+
+        if pending:
+            scored = _dispatch_batch(provider, pending)
+            with _sentiment_lock:
+                for text, (result, cacheable) in zip(pending, scored):
+                    if cacheable:
+                        _sentiment_cache[keys[text]] = result
+            for text, (result, _) in zip(pending, scored):
+                for index in positions[text]:
+                    results[index] = result
+
+    # Every slot is filled above: blanks directly, the rest via positions
+    return cast(List[Tuple[str, float]], results)
 
 
 def get_sentiment_provider_info() -> (
     Dict[str, Union[str, float, bool, List[str], None]]
 ):
     """Get information about the current sentiment analysis provider."""
-    provider = config.sentiment.sentiment_provider
+    provider = _PROVIDER
 
     info: Dict[str, Union[str, float, bool, List[str], None]] = {
         "provider": provider,
@@ -101,8 +273,8 @@ def get_sentiment_provider_info() -> (
     if provider == "VADER":
         info.update(
             {
-                "positive_threshold": config.sentiment.vader_positive_threshold,
-                "negative_threshold": config.sentiment.vader_negative_threshold,
+                "positive_threshold": _VADER_POS,
+                "negative_threshold": _VADER_NEG,
             }
         )
     elif provider == "GCP_NL":
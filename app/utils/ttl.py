@@ -1,20 +1,30 @@
 """Utility functions for TTL (Time To Live) management."""
 
 from datetime import datetime, timedelta, timezone
+from typing import Optional
 
 from app.config import settings
 
+# The TTL setting is fixed for the process lifetime, so derive these once
+CONTENT_TTL = timedelta(hours=settings.ARTICLE_CONTENT_TTL_HOURS)
+TTL_DESCRIPTION = (
+    f"Article content expires after {settings.ARTICLE_CONTENT_TTL_HOURS} hours"
+)
 
-def calculate_content_expiry() -> datetime:
+
+def calculate_content_expiry(now: Optional[datetime] = None) -> datetime:
     """
     Calculate the expiry timestamp for article content based on configured TTL.
 
+    Args:
+        now: Reference UTC timestamp (defaults to the current time)
+
     Returns:
         datetime: UTC timestamp when content should expire
     """
-    now = datetime.now(timezone.utc)
-    expiry = now + timedelta(hours=settings.ARTICLE_CONTENT_TTL_HOURS)
-    return expiry
+    if now is None:
+        now = datetime.now(timezone.utc)
+    return now + CONTENT_TTL
 
 
 def is_content_expired(expires_at: datetime) -> bool:
@@ -38,9 +48,10 @@ def get_ttl_info() -> dict:
     Returns:
         dict: TTL configuration details
     """
+    now = datetime.now(timezone.utc)
     return {
         "ttl_hours": settings.ARTICLE_CONTENT_TTL_HOURS,
-        "ttl_description": f"Article content expires after {settings.ARTICLE_CONTENT_TTL_HOURS} hours",
-        "current_utc": datetime.now(timezone.utc).isoformat(),
-        "next_expiry_would_be": calculate_content_expiry().isoformat(),
+        "ttl_description": TTL_DESCRIPTION,
+        "current_utc": now.isoformat(),
+        "next_expiry_would_be": calculate_content_expiry(now).isoformat(),
     }
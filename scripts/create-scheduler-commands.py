@@ -10,11 +10,11 @@ import sys
 # Add parent directory to path to import app modules
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.config import config  # noqa: E402
-
 
 def main() -> None:
     """Generate Cloud Scheduler commands"""
+    # Imported here so loading this module doesn't build the settings models
+    from app.config import config
 
     # Configuration from app
     service_url = "https://aifeelnews-web-813770885946.europe-west1.run.app"
@@ -5,6 +5,8 @@ Quick database inspection utility - shows recent articles with sentiment data
 import os
 import sys
 
+from sqlalchemy import func, select
+
 # Add project root to path so we can import app modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
@@ -16,9 +18,18 @@ def main():
     """Show recent articles with sentiment data"""
     db = SessionLocal()
     try:
-        articles = (
-            db.query(Article).order_by(Article.published_at.desc()).limit(5).all()
-        )
+        # One round-trip: the window count is computed before LIMIT applies
+        articles = db.execute(
+            select(
+                Article.published_at,
+                Article.title,
+                Article.sentiment_label,
+                Article.sentiment_score,
+                func.count().over().label("total"),
+            )
+            .order_by(Article.published_at.desc())
+            .limit(5)
+        ).all()
 
         print("🔍 Recent Articles with Sentiment Analysis")
         print("=" * 60)
@@ -40,7 +51,7 @@ def main():
             print(f"   📰 {a.title}")
             print()
 
-        print(f"Total articles in database: {db.query(Article).count()}")
+        print(f"Total articles in database: {articles[0].total}")
     finally:
         db.close()
 
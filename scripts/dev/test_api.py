@@ -15,6 +15,10 @@ import requests
 # Add project root to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
+# Poll /health until the server answers instead of sleeping a fixed time
+STARTUP_POLL_INTERVAL = 0.1
+STARTUP_TIMEOUT = 10.0
+
 
 def start_server():
     """Start the FastAPI server in background"""
@@ -34,12 +38,19 @@ def start_server():
             "8002",
         ],
         env=env,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
+        # Unread pipes fill up and stall uvicorn once its log exceeds the buffer
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
     )
 
-    # Wait a bit for server to start
-    time.sleep(3)
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline and proc.poll() is None:
+        try:
+            if requests.get("http://127.0.0.1:8002/health", timeout=0.5).ok:
+                break
+        except requests.RequestException:
+            pass
+        time.sleep(STARTUP_POLL_INTERVAL)
     return proc
 
 
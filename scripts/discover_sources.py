@@ -1,5 +1,6 @@
 import csv
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 
@@ -43,15 +44,29 @@ SEARCH_TERMS = [
     "discovery",
 ]
 
+# Keyword searches are independent, so they run concurrently
+MAX_WORKERS = 8
+
 seen_codes = set()
 sources = []
 
+session = requests.Session()
+
 
 def fetch_sources_by_keyword(keyword):
+    print(f"Searching sources with keyword: {keyword}")
     params = {"access_key": API_KEY, "search": keyword, "languages": "en"}
-    response = requests.get(BASE_URL, params=params)
+    response = session.get(BASE_URL, params=params)
     if response.status_code == 200:
-        for source in response.json().get("data", []):
+        return response.json().get("data", [])
+    return []
+
+
+def merge_sources(results):
+    # Merge after all searches finish, in SEARCH_TERMS order, so dedup is
+    # single-threaded and the CSV order is stable
+    for found in results:
+        for source in found:
             code = source["code"]
             if code not in seen_codes:
                 seen_codes.add(code)
@@ -77,7 +92,6 @@ def save_sources_to_csv():
 
 
 if __name__ == "__main__":
-    for term in SEARCH_TERMS:
-        print(f"Searching sources with keyword: {term}")
-        fetch_sources_by_keyword(term)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        merge_sources(executor.map(fetch_sources_by_keyword, SEARCH_TERMS))
     save_sources_to_csv()
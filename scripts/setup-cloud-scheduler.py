@@ -29,18 +29,19 @@ def run_gcloud_command(cmd: List[str]) -> bool:
 
 def create_ingestion_job() -> bool:
     """Create the main ingestion job (every 8 hours)."""
+    sched = config.scheduler
     cmd = [
         "gcloud",
         "scheduler",
         "jobs",
         "create",
         "http",
-        config.scheduler.ingestion_job_name,
-        f"--schedule={config.scheduler.ingestion_schedule}",
-        f"--time-zone={config.scheduler.ingestion_timezone}",
-        f"--uri={config.scheduler.trigger_url}",
+        sched.ingestion_job_name,
+        f"--schedule={sched.ingestion_schedule}",
+        f"--time-zone={sched.ingestion_timezone}",
+        f"--uri={sched.trigger_url}",
         "--http-method=POST",
-        f"--location={config.scheduler.scheduler_region}",
+        f"--location={sched.scheduler_region}",
         "--description=Automated news ingestion (every 8 hours, optimized for API limits)",
     ]
     return run_gcloud_command(cmd)
@@ -48,8 +49,9 @@ def create_ingestion_job() -> bool:
 
 def create_cleanup_job() -> bool:
     """Create the cleanup job (daily at 2 AM)."""
+    sched = config.scheduler
     # Note: We'll need a cleanup endpoint in the future
-    cleanup_url = f"{config.scheduler.service_url}/api/v1/cleanup"
+    cleanup_url = f"{sched.service_url}/api/v1/cleanup"
 
     cmd = [
         "gcloud",
@@ -57,12 +59,12 @@ def create_cleanup_job() -> bool:
         "jobs",
         "create",
         "http",
-        config.scheduler.cleanup_job_name,
-        f"--schedule={config.scheduler.cleanup_schedule}",
-        f"--time-zone={config.scheduler.cleanup_timezone}",
+        sched.cleanup_job_name,
+        f"--schedule={sched.cleanup_schedule}",
+        f"--time-zone={sched.cleanup_timezone}",
         f"--uri={cleanup_url}",
         "--http-method=POST",
-        f"--location={config.scheduler.scheduler_region}",
+        f"--location={sched.scheduler_region}",
         "--description=Daily cleanup of expired content (TTL cleanup)",
     ]
     return run_gcloud_command(cmd)
@@ -12,20 +12,25 @@ Usage: python scripts/verify-deployment.py [URL]
 """
 
 import argparse
+import json
 import sys
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
 
 import requests
 
 
 def check_endpoint(
-    url: str, endpoint: str, expected_status: int = 200
+    url: str,
+    endpoint: str,
+    expected_status: int = 200,
+    session: requests.Session | None = None,
 ) -> Dict[str, Any]:
     """Check a specific endpoint and return results."""
     full_url = f"{url.rstrip('/')}/{endpoint.lstrip('/')}"
 
     try:
-        response = requests.get(full_url, timeout=30)
+        response = (session or requests).get(full_url, timeout=30)
 
         result = {
             "endpoint": endpoint,
@@ -35,11 +40,12 @@ def check_endpoint(
             "response_time": response.elapsed.total_seconds(),
         }
 
-        # Try to parse JSON response
+        # Decode the body once, then try to parse it as JSON
+        body = response.text
         try:
-            result["response_data"] = response.json()
-        except Exception:
-            result["response_data"] = response.text[:200]
+            result["response_data"] = json.loads(body)
+        except ValueError:
+            result["response_data"] = body[:200]
 
         return result
 
@@ -52,6 +58,19 @@ def check_endpoint(
         }
 
 
+def check_endpoints(
+    url: str, endpoints: List[Dict[str, str]], session: requests.Session
+) -> List[Dict[str, Any]]:
+    """Check independent endpoints concurrently; results follow input order."""
+    with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+        return list(
+            executor.map(
+                lambda endpoint: check_endpoint(url, endpoint["path"], session=session),
+                endpoints,
+            )
+        )
+
+
 def verify_deployment(base_url: str) -> bool:
     """Verify the deployment by checking multiple endpoints."""
     print(f"🔍 Verifying deployment at: {base_url}")
@@ -67,13 +86,12 @@ def verify_deployment(base_url: str) -> bool:
     ]
 
     all_passed = True
-    results = []
+    session = requests.Session()
 
-    for endpoint in endpoints:
-        print(f"Testing {endpoint['name']}...")
-        result = check_endpoint(base_url, endpoint["path"])
-        results.append(result)
+    print(f"Testing {len(endpoints)} endpoints...")
+    results = check_endpoints(base_url, endpoints, session)
 
+    for endpoint, result in zip(endpoints, results):
         if result["success"]:
             print(f"✅ {endpoint['name']}: OK ({result.get('response_time', 0):.2f}s)")
             if "response_data" in result and isinstance(result["response_data"], dict):
@@ -94,10 +112,9 @@ def verify_deployment(base_url: str) -> bool:
         {"path": "/trigger/cleanup", "name": "Cleanup Trigger"},
     ]
 
-    for endpoint in trigger_endpoints:
-        print(f"Testing {endpoint['name']}...")
-        result = check_endpoint(base_url, endpoint["path"])
+    trigger_results = check_endpoints(base_url, trigger_endpoints, session)
 
+    for endpoint, result in zip(trigger_endpoints, trigger_results):
         if result["success"]:
             print(f"✅ {endpoint['name']}: OK ({result.get('response_time', 0):.2f}s)")
             if "response_data" in result:
@@ -1,35 +1,111 @@
 """Test configuration and fixtures."""
 
+from datetime import datetime, timezone
+
 import pytest
 from sqlalchemy import create_engine, event
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
+import app.models  # noqa: F401 - register every table on Base.metadata
+from app.config import config
 from app.database import Base
+from app.models.article import Article
+from app.models.source import Source
+from app.utils.sentiment import reload_sentiment_thresholds
 
 
-@pytest.fixture(scope="function")
-def test_db():
-    """Create a fresh in-memory SQLite database for each test."""
-    # Use unique connection for each test to ensure proper isolation
+@pytest.fixture(scope="session")
+def test_engine():
+    """Create one in-memory SQLite database with the schema for the whole run."""
+    # StaticPool keeps the single in-memory connection alive across tests
     engine = create_engine(
-        "sqlite:///:memory:", echo=False, connect_args={"check_same_thread": False}
+        "sqlite://",
+        echo=False,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
     )
 
-    # Enable foreign key constraints in SQLite
     @event.listens_for(engine, "connect")
     def set_sqlite_pragma(dbapi_connection, connection_record):
+        # Enable foreign key constraints in SQLite
         cursor = dbapi_connection.cursor()
         cursor.execute("PRAGMA foreign_keys=ON")
         cursor.close()
+        # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work under pysqlite
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
 
-    # Create all tables - fresh in-memory database so no conflicts
+    # Create all tables once; each test rolls its changes back
     Base.metadata.create_all(engine)
 
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    db = SessionLocal()
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+@pytest.fixture(scope="function")
+def test_db(test_engine):
+    """Yield a session whose work, including commits, is rolled back after the test."""
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    # Session commits/rollbacks only release or roll back SAVEPOINTs
+    db = Session(
+        bind=connection,
+        autoflush=False,
+        join_transaction_mode="create_savepoint",
+    )
 
     try:
         yield db
     finally:
         db.close()
-        engine.dispose()
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope="function")
+def make_article(test_db):
+    """Return a factory that adds articles under one shared test source."""
+    # Linked through the relationship, so the first article's flush inserts it
+    source = Source(name="test-source")
+    test_db.add(source)
+
+    def _make_article(
+        url: str = "https://example.com/test", title: str = "Test Article"
+    ) -> Article:
+        article = Article(
+            source=source,
+            title=title,
+            url=url,
+            published_at=datetime.now(timezone.utc),
+        )
+        test_db.add(article)
+        # Flushed so tests can use article.id for child rows
+        test_db.flush()
+        return article
+
+    return _make_article
+
+
+@pytest.fixture(scope="function")
+def article(make_article):
+    """A single flushed article under the shared test source."""
+    return make_article()
+
+
+@pytest.fixture(scope="function")
+def vader_sentiment(monkeypatch):
+    """Switch sentiment analysis to VADER for one test, then restore config."""
+    monkeypatch.setattr(config.sentiment, "sentiment_provider", "VADER")
+    reload_sentiment_thresholds()
+    try:
+        yield
+    finally:
+        # Undo first so the reload picks the original provider back up
+        monkeypatch.undo()
+        reload_sentiment_thresholds()
@@ -0,0 +1,153 @@
+"""Tests for article API responses."""
+
+import json
+import warnings
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.database import get_db
+from app.jobs import crawl_worker
+from app.main import app
+from app.models.article import Article
+from app.models.crawl_job import CrawlJob, CrawlStatus
+from app.routers import articles as articles_router
+from app.routers.articles import _article_list_adapter, _serialize_articles
+from app.utils.article_cache import invalidate_article_cache
+
+
+@pytest.fixture(scope="function")
+def client(test_db):
+    """TestClient bound to the test session, with an empty response cache."""
+    app.dependency_overrides[get_db] = lambda: test_db
+    invalidate_article_cache()
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        invalidate_article_cache()
+
+
+def test_fast_serialization_matches_validated_output(test_db, make_article):
+    """Test the model_construct path serializes exactly like full validation."""
+    make_article("https://example.com", " Root page ")
+    make_article("https://ex.com/a b/ü", "Encoded path")
+    articles = test_db.query(Article).order_by(Article.id).all()
+
+    validated = _article_list_adapter.dump_json(
+        _article_list_adapter.validate_python(articles, from_attributes=True)
+    )
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        fast = _serialize_articles(articles)
+
+    assert fast == validated
+    items = json.loads(fast)
+    assert [item["url"] for item in items] == [
+        "https://example.com/",
+        "https://ex.com/a%20b/%C3%BC",
+    ]
+    assert items[0]["title"] == "Root page"
+
+
+def test_article_endpoint_normalizes_url(client, article):
+    """Test the single-article endpoint returns the HttpUrl-normalized url."""
+    article.url = "https://example.com"
+
+    response = client.get(f"/articles/{article.id}")
+
+    assert response.status_code == 200
+    assert response.json()["url"] == "https://example.com/"
+
+
+def test_article_feed_is_served_from_cache(client, make_article):
+    """Test a repeated feed request reuses the cached body until invalidated."""
+    make_article("https://example.com/first", "First")
+    first = client.get("/articles/")
+
+    make_article("https://example.com/second", "Second")
+    cached = client.get("/articles/")
+    invalidate_article_cache()
+    fresh = client.get("/articles/")
+
+    assert cached.content == first.content
+    assert len(cached.json()) == 1
+    assert len(fresh.json()) == 2
+
+
+def test_article_cache_keys_on_parameters(client, make_article):
+    """Test different limits are cached as separate responses."""
+    make_article("https://example.com/first", "First")
+    make_article("https://example.com/second", "Second")
+
+    assert len(client.get("/articles/?limit=1").json()) == 1
+    assert len(client.get("/articles/?limit=2").json()) == 2
+
+
+def test_repeated_article_request_is_a_cache_hit(client, article, test_db, monkeypatch):
+    """Test the second request neither queries the database nor re-serializes."""
+    serialized = []
+    serialize = articles_router._serialize_article
+
+    def spy(obj):
+        serialized.append(obj.id)
+        return serialize(obj)
+
+    monkeypatch.setattr(articles_router, "_serialize_article", spy)
+
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(test_db.connection(), "before_cursor_execute", record)
+
+    first = client.get(f"/articles/{article.id}")
+    queries_after_first = len(statements)
+    second = client.get(f"/articles/{article.id}")
+
+    assert serialized == [article.id]
+    assert queries_after_first > 0
+    assert len(statements) == queries_after_first
+    assert second.content == first.content
+
+
+def test_crawl_invalidates_cached_sentiment(
+    client, article, test_db, monkeypatch, vader_sentiment
+):
+    """Test a successful crawl drops cached responses with the old sentiment."""
+    from app.utils import bigquery
+
+    class _Response:
+        status_code = 200
+        content = b"<html></html>"
+        text = "<html></html>"
+
+        def raise_for_status(self):
+            pass
+
+    monkeypatch.setattr(
+        crawl_worker,
+        "check_robots_compliance",
+        lambda url: {"allowed": True, "reason": "Allowed by robots.txt"},
+    )
+    monkeypatch.setattr(crawl_worker, "respect_crawl_delay", lambda *args: True)
+    monkeypatch.setattr(crawl_worker.requests, "get", lambda *a, **kw: _Response())
+    monkeypatch.setattr(
+        crawl_worker, "extract_article_text", lambda html, url: "Great news."
+    )
+    monkeypatch.setattr(
+        crawl_worker, "analyze_sentiment", lambda text: ("positive", 0.8)
+    )
+    monkeypatch.setattr(bigquery, "stream_article_sentiment", lambda **kw: True)
+
+    assert client.get(f"/articles/{article.id}").json()["sentiment_label"] is None
+
+    crawl_job = CrawlJob(article_id=article.id, status=CrawlStatus.PENDING)
+    test_db.add(crawl_job)
+    test_db.flush()
+    assert crawl_worker.crawl_article(crawl_job, test_db)
+
+    response = client.get(f"/articles/{article.id}")
+    assert response.json()["sentiment_label"] == "positive"
@@ -0,0 +1,66 @@
+"""Tests for BigQuery sentiment event payloads."""
+
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from app.utils import bigquery
+
+
+class _RecordingRepo:
+    def __init__(self) -> None:
+        self.events = []
+
+    def stream_sentiment_event(self, event_data):
+        self.events.append(event_data)
+        return True
+
+
+@pytest.fixture
+def repo(monkeypatch):
+    """Capture streamed events instead of sending them to BigQuery."""
+    recording = _RecordingRepo()
+    monkeypatch.setattr(bigquery, "get_bq_repo", lambda: recording)
+    return recording
+
+
+@pytest.fixture
+def non_utc_local_time(monkeypatch):
+    """Run the test with the process clock in a zone that is not UTC."""
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    try:
+        yield
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+
+
+def _stream(published_at: datetime) -> None:
+    bigquery.stream_article_sentiment(
+        article_id=1,
+        article_url="https://example.com/a",
+        article_title="Title",
+        source_name="source",
+        published_at=published_at,
+        sentiment_score=0.5,
+        sentiment_label="positive",
+    )
+
+
+def test_naive_published_at_is_treated_as_utc(repo, non_utc_local_time):
+    """Test naive timestamps (as SQLite returns them) are not shifted to local time."""
+    _stream(datetime(2025, 11, 18, 10, 0))
+
+    expected = datetime(2025, 11, 18, 10, 0, tzinfo=timezone.utc).timestamp()
+    assert repo.events[0]["published_at"] == expected
+
+
+def test_aware_published_at_keeps_its_offset(repo, non_utc_local_time):
+    """Test timezone-aware timestamps are converted using their own offset."""
+    published_at = datetime(2025, 11, 18, 10, 0, tzinfo=timezone.utc)
+
+    _stream(published_at)
+
+    assert repo.events[0]["published_at"] == published_at.timestamp()
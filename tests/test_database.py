@@ -0,0 +1,50 @@
+"""Tests for the application database engine."""
+
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+import app.models  # noqa: F401 - register every table on Base.metadata
+from app.database import Base, _enable_sqlite_foreign_keys, engine
+from app.models.article import Article
+from app.models.crawl_job import CrawlJob, CrawlStatus
+from app.models.source import Source
+
+
+def test_sqlite_engine_enforces_foreign_keys():
+    """Test app SQLite connections cascade deletes like the other databases."""
+    if engine.dialect.name != "sqlite":
+        pytest.skip("foreign_keys pragma only applies to SQLite")
+
+    with engine.connect() as connection:
+        enabled = connection.exec_driver_sql("PRAGMA foreign_keys").scalar()
+
+    assert enabled == 1
+
+
+def test_deleting_article_removes_unloaded_children():
+    """Test passive_deletes relies on ON DELETE CASCADE, which the pragma enables."""
+    sqlite_engine = create_engine("sqlite://")
+    event.listen(sqlite_engine, "connect", _enable_sqlite_foreign_keys)
+    Base.metadata.create_all(sqlite_engine)
+
+    with Session(sqlite_engine) as db:
+        article = Article(
+            source=Source(name="source"),
+            title="Title",
+            url="https://example.com/a",
+            published_at=datetime.now(timezone.utc),
+        )
+        db.add(CrawlJob(article=article, status=CrawlStatus.SUCCESS))
+        db.commit()
+        article_id = article.id
+
+    # A fresh session, so the crawl jobs are never loaded into the ORM
+    with Session(sqlite_engine) as db:
+        db.delete(db.get(Article, article_id))
+        db.commit()
+        assert db.query(CrawlJob).count() == 0
+
+    sqlite_engine.dispose()
@@ -0,0 +1,64 @@
+"""Tests for concurrent Mediastack source fetching."""
+
+import threading
+
+from app.jobs import fetch_from_mediastack
+
+
+def test_iter_source_batches_yields_sources_as_they_finish(monkeypatch):
+    """Test a slow source doesn't hold back batches that are already fetched."""
+    release_slow = threading.Event()
+
+    def fetch(source):
+        if source == "slow":
+            release_slow.wait(timeout=5)
+        return [{"source_name": source}]
+
+    monkeypatch.setattr(fetch_from_mediastack, "SOURCES", ["slow", "fast"])
+    monkeypatch.setattr(fetch_from_mediastack, "fetch_articles_from_source", fetch)
+
+    batches = fetch_from_mediastack.iter_source_batches()
+    try:
+        first_source, first_articles = next(batches)
+    finally:
+        release_slow.set()
+    rest = dict(batches)
+
+    assert first_source == "fast"
+    assert first_articles == [{"source_name": "fast"}]
+    assert rest == {"slow": [{"source_name": "slow"}]}
+
+
+def test_iter_source_batches_runs_sources_concurrently(monkeypatch):
+    """Test every source is in flight at once when workers allow it."""
+    sources = ["a", "b", "c"]
+    barrier = threading.Barrier(len(sources), timeout=5)
+
+    def fetch(source):
+        # Only passes if all sources are being fetched at the same time
+        barrier.wait()
+        return [{"source_name": source}]
+
+    monkeypatch.setattr(fetch_from_mediastack, "SOURCES", sources)
+    monkeypatch.setattr(fetch_from_mediastack, "fetch_articles_from_source", fetch)
+
+    batches = dict(fetch_from_mediastack.iter_source_batches())
+
+    assert set(batches) == set(sources)
+
+
+def test_iter_source_batches_isolates_source_errors(monkeypatch):
+    """Test one failing source doesn't drop the other sources' batches."""
+
+    def fetch(source):
+        if source == "broken":
+            raise RuntimeError("boom")
+        return [{"source_name": source}]
+
+    monkeypatch.setattr(fetch_from_mediastack, "SOURCES", ["ok", "broken", "ok2"])
+    monkeypatch.setattr(fetch_from_mediastack, "fetch_articles_from_source", fetch)
+
+    batches = dict(fetch_from_mediastack.iter_source_batches())
+
+    assert set(batches) == {"ok", "ok2"}
+    assert batches["ok2"] == [{"source_name": "ok2"}]
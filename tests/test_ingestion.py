@@ -1,20 +1,38 @@
 """Test basic ingestion functionality."""
 
-from app.jobs.ingest_articles import get_or_create_source, ingest_articles
-from app.jobs.normalize_articles import normalize_articles
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlparse, urlunparse
+
+import pytest
+from dateutil import parser
+
+from app.jobs.ingest_articles import get_or_create_source_ids, ingest_articles
+from app.jobs.normalize_articles import (
+    canonicalize_url,
+    normalize_articles,
+    parse_published_at,
+)
 from app.models.article import Article
+from app.models.source import Source
 
 
-def test_get_or_create_source(test_db):
-    """Test source creation and retrieval."""
-    # Test creating a new source
-    source1 = get_or_create_source(test_db, "test-source")
-    assert source1.name == "test-source"
-    assert source1.id is not None
+def test_get_or_create_source_ids(test_db):
+    """Test bulk source lookup creates only missing sources."""
+    existing = Source(name="existing-source")
+    test_db.add(existing)
+    test_db.flush()
 
-    # Test retrieving existing source
-    source2 = get_or_create_source(test_db, "test-source")
-    assert source1.id == source2.id
+    source_ids = get_or_create_source_ids(test_db, {"existing-source", "new-source"})
+
+    assert source_ids["existing-source"] == existing.id
+    assert source_ids["new-source"] is not None
+    assert source_ids["new-source"] != existing.id
+
+    # Calling again doesn't create duplicates
+    assert get_or_create_source_ids(test_db, {"new-source"}) == {
+        "new-source": source_ids["new-source"]
+    }
+    assert test_db.query(Source).count() == 2
 
 
 def test_normalize_articles():
@@ -43,10 +61,84 @@ def test_normalize_articles():
     assert isinstance(article["sentiment_score"], float)
 
 
+def test_canonicalize_url():
+    """Test URL canonicalization drops query, fragment and ;params only."""
+    assert canonicalize_url("https://e.com/a/b;sid=1?x=2#top") == "https://e.com/a/b"
+    assert canonicalize_url("https://e.com/a;x/b") == "https://e.com/a;x/b"
+    assert canonicalize_url("https://e.com:8080/story.html") == (
+        "https://e.com:8080/story.html"
+    )
+
+
+@pytest.mark.parametrize(
+    "raw_url",
+    [
+        "https://e.com/a/b;sid=1?x=2#top",
+        "https://e.com/a;x/b",
+        "https://e.com:8080/story.html",
+        "https://e.com",
+        "https://e.com/",
+        "https://e.com?x=1",
+        "https://e.com#top;x",
+        "https://e.com/a;",
+        "HTTPS://E.com/a?b",
+        "Http://e.com/a;p",
+        "https://e.com;x",
+        "https://e.com;x/a;y",
+        "https://e.com/a\tb",
+        "https://e.com/a\n?x",
+        "https://e.\ncom/a",
+        " https://e.com/a",
+        "\x00https://e.com/a;p",
+        "https://e.com/a ",
+        "https://ex.com/a b/\u00fc",
+        "https://b\u00fccher.de/a;p",
+        "https://[::1]:8080/a;p",
+        "https:///a;p",
+        "//e.com/a;p",
+        "e.com/a;p",
+    ],
+)
+def test_canonicalize_url_matches_urlunparse(raw_url):
+    """Test the fast path gives exactly the urlparse / urlunparse result."""
+    p = urlparse(raw_url)
+    expected = urlunparse((p.scheme, p.netloc, p.path, "", "", ""))
+
+    assert canonicalize_url(raw_url) == expected
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2025-11-18T10:00:00+00:00",
+        "2025-11-18T10:00:00Z",
+        "2025-11-18T10:00:00.123456+02:00",
+        "2025-11-18T10:00:00",
+        "2025-11-18",
+        "20251118T100000Z",
+    ],
+)
+def test_parse_published_at_matches_isoparse(value):
+    """Test the fromisoformat fast path agrees with dateutil's isoparse."""
+    assert parse_published_at(value) == parser.isoparse(value)
+
+
+def test_parse_published_at_keeps_timezone():
+    """Test a trailing Z is parsed as UTC rather than a naive datetime."""
+    parsed = parse_published_at("2025-11-18T10:00:00Z")
+
+    assert parsed == datetime(2025, 11, 18, 10, 0, tzinfo=timezone.utc)
+    assert parsed.utcoffset() == timedelta(0)
+
+
+@pytest.mark.parametrize("value", [None, "", "not a date", "2025-13-45T99:00:00"])
+def test_parse_published_at_rejects_invalid(value):
+    """Test missing or unparseable timestamps yield None instead of raising."""
+    assert parse_published_at(value) is None
+
+
 def test_ingest_articles(test_db):
     """Test article ingestion with deduplication."""
-    from datetime import datetime, timezone
-
     now = datetime.now(timezone.utc)
 
     articles = [
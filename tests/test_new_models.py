@@ -3,6 +3,7 @@
 from datetime import datetime, timedelta, timezone
 
 import pytest
+from sqlalchemy import insert
 from sqlalchemy.exc import IntegrityError
 
 from app.jobs.ttl_cleanup import cleanup_expired_content, get_content_statistics
@@ -11,25 +12,11 @@ from app.models.article_content import ArticleContent
 from app.models.crawl_job import CrawlJob, CrawlStatus
 from app.models.sentiment_analysis import SentimentAnalysis
 from app.models.source import Source
+from app.utils.cleanup import cleanup_old_crawl_jobs
 
 
-def test_crawl_job_model(test_db):
+def test_crawl_job_model(test_db, article):
     """Test CrawlJob model functionality."""
-    # Create source and article first
-    source = Source(name="test-source")
-    test_db.add(source)
-    test_db.flush()
-
-    now = datetime.now(timezone.utc)
-    article = Article(
-        source_id=source.id,
-        title="Test Article",
-        url="https://example.com/test",
-        published_at=now,
-    )
-    test_db.add(article)
-    test_db.flush()
-
     # Create crawl job
     crawl_job = CrawlJob(
         article_id=article.id, status=CrawlStatus.PENDING, robots_allowed=True
@@ -57,22 +44,9 @@ def test_crawl_job_model(test_db):
     assert retrieved.bytes_downloaded == 1500
 
 
-def test_article_content_model(test_db):
+def test_article_content_model(test_db, article):
     """Test ArticleContent model and TTL functionality."""
-    # Create source and article first
-    source = Source(name="test-source")
-    test_db.add(source)
-    test_db.flush()
-
     now = datetime.now(timezone.utc)
-    article = Article(
-        source_id=source.id,
-        title="Test Article",
-        url="https://example.com/test",
-        published_at=now,
-    )
-    test_db.add(article)
-    test_db.flush()
 
     # Create article content with TTL
     expires_at = now + timedelta(hours=24)
@@ -104,23 +78,8 @@ def test_article_content_model(test_db):
         test_db.commit()
 
 
-def test_sentiment_analysis_model(test_db):
+def test_sentiment_analysis_model(test_db, article):
     """Test SentimentAnalysis model functionality."""
-    # Create source and article first
-    source = Source(name="test-source")
-    test_db.add(source)
-    test_db.flush()
-
-    now = datetime.now(timezone.utc)
-    article = Article(
-        source_id=source.id,
-        title="Test Article",
-        url="https://example.com/test",
-        published_at=now,
-    )
-    test_db.add(article)
-    test_db.flush()
-
     # Create multiple sentiment analyses (different providers)
     vader_analysis = SentimentAnalysis(
         article_id=article.id,
@@ -167,24 +126,12 @@ def test_sentiment_analysis_model(test_db):
     assert gcp_result.magnitude == 0.8
 
 
-def test_ttl_cleanup_functionality(test_db):
+def test_ttl_cleanup_functionality(test_db, make_article):
     """Test TTL cleanup job functionality."""
-    # Create source and articles
-    source = Source(name="test-source")
-    test_db.add(source)
-    test_db.flush()
-
     now = datetime.now(timezone.utc)
 
     # Article 1 with expired content
-    article1 = Article(
-        source_id=source.id,
-        title="Article 1",
-        url="https://example.com/article1",
-        published_at=now,
-    )
-    test_db.add(article1)
-    test_db.flush()
+    article1 = make_article("https://example.com/article1", "Article 1")
 
     expired_content = ArticleContent(
         article_id=article1.id,
@@ -196,14 +143,7 @@ def test_ttl_cleanup_functionality(test_db):
     test_db.add(expired_content)
 
     # Article 2 with active content
-    article2 = Article(
-        source_id=source.id,
-        title="Article 2",
-        url="https://example.com/article2",
-        published_at=now,
-    )
-    test_db.add(article2)
-    test_db.flush()
+    article2 = make_article("https://example.com/article2", "Article 2")
 
     active_content = ArticleContent(
         article_id=article2.id,
@@ -220,13 +160,13 @@ def test_ttl_cleanup_functionality(test_db):
     assert total_content == 2
 
     # Get statistics before cleanup
-    stats_before = get_content_statistics(test_db)
+    stats_before = get_content_statistics(test_db, now=now)
     assert stats_before["total_records"] == 2
     assert stats_before["expired_records"] == 1
     assert stats_before["active_records"] == 1
 
     # Run TTL cleanup
-    result = cleanup_expired_content(test_db)
+    result = cleanup_expired_content(test_db, now=now)
     assert result["status"] == "success"
     assert result["deleted_count"] == 1
 
@@ -239,28 +179,83 @@ def test_ttl_cleanup_functionality(test_db):
     assert remaining.content_hash == "active_hash"
 
     # Get statistics after cleanup
-    stats_after = get_content_statistics(test_db)
+    stats_after = get_content_statistics(test_db, now=now)
     assert stats_after["total_records"] == 1
     assert stats_after["expired_records"] == 0
     assert stats_after["active_records"] == 1
 
 
-def test_cascade_deletions(test_db):
-    """Test that cascade deletions work properly."""
-    # Create source and article
-    source = Source(name="test-source")
+def test_ttl_cleanup_batches(test_db):
+    """Test TTL cleanup deletes an expired backlog across several batches."""
+    source = Source(name="batch-source")
     test_db.add(source)
     test_db.flush()
 
+    # Bulk INSERTs: one statement per table instead of an add/flush per row
     now = datetime.now(timezone.utc)
-    article = Article(
-        source_id=source.id,
-        title="Test Article",
-        url="https://example.com/test",
-        published_at=now,
+    article_ids = test_db.scalars(
+        insert(Article).returning(Article.id, sort_by_parameter_order=True),
+        [
+            {
+                "source_id": source.id,
+                "title": f"Batch article {i}",
+                "url": f"https://example.com/batch{i}",
+                "published_at": now,
+            }
+            for i in range(5)
+        ],
+    ).all()
+    test_db.execute(
+        insert(ArticleContent),
+        [
+            {
+                "article_id": article_id,
+                "content_text": "Expired content",
+                "content_hash": f"batch_hash_{i}",
+                "content_length": 100,
+                "expires_at": now - timedelta(hours=1),
+            }
+            for i, article_id in enumerate(article_ids)
+        ],
     )
-    test_db.add(article)
-    test_db.flush()
+    test_db.commit()
+
+    result = cleanup_expired_content(test_db, batch_size=2, now=now)
+    assert result["status"] == "success"
+    assert result["deleted_count"] == 5
+    assert test_db.query(ArticleContent).count() == 0
+
+
+@pytest.mark.parametrize("batch_size", [0, -1])
+def test_ttl_cleanup_rejects_non_positive_batch_size(test_db, batch_size):
+    """Test TTL cleanup refuses batch sizes that would never finish."""
+    with pytest.raises(ValueError):
+        cleanup_expired_content(test_db, batch_size=batch_size)
+
+
+def test_cleanup_old_crawl_jobs(test_db, article):
+    """Test only old jobs in terminal statuses are removed and reported."""
+    old = datetime.now(timezone.utc) - timedelta(days=30)
+    test_db.add_all(
+        [
+            CrawlJob(article_id=article.id, status=CrawlStatus.SUCCESS, created_at=old),
+            CrawlJob(article_id=article.id, status=CrawlStatus.FAILED, created_at=old),
+            CrawlJob(article_id=article.id, status=CrawlStatus.PENDING, created_at=old),
+            CrawlJob(article_id=article.id, status=CrawlStatus.SUCCESS),
+        ]
+    )
+    test_db.commit()
+
+    result = cleanup_old_crawl_jobs(test_db, days_old=7)
+
+    assert result["old_crawl_jobs_deleted"] == 2
+    assert result["old_crawl_jobs_found"] == 2
+    assert test_db.query(CrawlJob).count() == 2
+
+
+def test_cascade_deletions(test_db, article):
+    """Test that cascade deletions work properly."""
+    now = datetime.now(timezone.utc)
 
     # Create related records
     crawl_job = CrawlJob(article_id=article.id, status=CrawlStatus.SUCCESS)
@@ -277,9 +272,9 @@ def test_cascade_deletions(test_db):
         article_id=article.id, provider="VADER", score=0.5, label="neutral"
     )
 
-    test_db.add(crawl_job)
-    test_db.add(content)
-    test_db.add(sentiment)
+    # Children aren't needed back as objects, so skip per-row RETURNING; the
+    # delete below then relies on the ON DELETE CASCADE foreign keys
+    test_db.bulk_save_objects([crawl_job, content, sentiment], return_defaults=False)
     test_db.commit()
 
     # Verify all records exist
@@ -0,0 +1,164 @@
+"""Tests for robots.txt caching and single-flight fetching."""
+
+import os
+import tempfile
+import threading
+import time
+from urllib.robotparser import RobotFileParser
+
+import pytest
+
+from app.config.crawler import CrawlerConfig
+from app.utils import robots
+from app.utils import robots_store as robots_store_module
+
+
+def _parser(*lines: str) -> RobotFileParser:
+    parser = RobotFileParser()
+    parser.parse(list(lines))
+    return parser
+
+
+@pytest.fixture(autouse=True)
+def isolated_robots(monkeypatch):
+    """Start every test with empty in-memory caches and no persistent store."""
+    monkeypatch.setattr(robots, "load_robots_body", lambda domain, ttl: None)
+    robots._robots_cache.clear()
+    try:
+        yield
+    finally:
+        robots._robots_cache.clear()
+
+
+def test_wait_timeout_covers_leader_worst_case():
+    """Test followers wait at least as long as a leader can take to fetch."""
+    attempts = (robots.ROBOTS_FETCH_RETRIES + 1) * 2  # HTTPS, then HTTP
+    assert robots.ROBOTS_FETCH_WAIT_TIMEOUT > attempts * robots.ROBOTS_FETCH_TIMEOUT
+
+
+def test_cached_parser_is_reused(monkeypatch):
+    """Test a second lookup for the same domain hits the cache."""
+    calls = []
+
+    def fake_fetch(domain):
+        calls.append(domain)
+        return _parser("User-agent: *", "Disallow: /private")
+
+    monkeypatch.setattr(robots, "fetch_robots_txt", fake_fetch)
+
+    first = robots.get_robots_parser("example.com")
+    second = robots.get_robots_parser("example.com")
+
+    assert first is second
+    assert calls == ["example.com"]
+
+
+def test_concurrent_callers_share_one_fetch(monkeypatch):
+    """Test concurrent lookups for a cold domain trigger a single fetch."""
+    calls = []
+    release = threading.Event()
+
+    def slow_fetch(domain):
+        calls.append(domain)
+        release.wait(timeout=5)
+        return _parser("User-agent: *", "Disallow: /private")
+
+    monkeypatch.setattr(robots, "fetch_robots_txt", slow_fetch)
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(robots.get_robots_parser("example.com"))
+        )
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert calls == ["example.com"]
+    assert len(results) == 5
+    assert all(result is results[0] for result in results)
+
+
+def test_follower_fetches_itself_when_leader_stalls(monkeypatch):
+    """Test a follower that outwaits a slow leader still honours robots.txt."""
+    leader_started = threading.Event()
+    release_leader = threading.Event()
+    calls = []
+
+    def fetch(domain):
+        calls.append(domain)
+        if len(calls) == 1:
+            leader_started.set()
+            release_leader.wait(timeout=5)
+            return None
+        return _parser("User-agent: *", "Disallow: /private")
+
+    monkeypatch.setattr(robots, "fetch_robots_txt", fetch)
+    monkeypatch.setattr(robots, "ROBOTS_FETCH_WAIT_TIMEOUT", 0.05)
+
+    leader = threading.Thread(target=robots.get_robots_parser, args=("example.com",))
+    leader.start()
+    try:
+        assert leader_started.wait(timeout=5)
+        allowed, _ = robots.is_url_allowed("https://example.com/private/page")
+    finally:
+        release_leader.set()
+        leader.join(timeout=5)
+
+    assert allowed is False
+    assert len(calls) == 2
+
+
+@pytest.fixture
+def robots_store(tmp_path, monkeypatch):
+    """Point the persistent robots.txt store at a fresh file for one test."""
+    monkeypatch.setattr(
+        robots_store_module.config.crawler,
+        "crawler_robots_store_path",
+        str(tmp_path / "robots_cache.db"),
+    )
+    monkeypatch.setattr(robots_store_module, "_connection", None)
+    monkeypatch.setattr(robots_store_module, "_store_disabled", False)
+    try:
+        yield robots_store_module
+    finally:
+        if robots_store_module._connection is not None:
+            robots_store_module._connection.close()
+
+
+def test_store_round_trip(robots_store):
+    """Test a saved robots.txt body is loaded back while fresh."""
+    robots_store.save_robots_body("example.com", ["User-agent: *", "Disallow: /x"])
+
+    body = robots_store.load_robots_body("example.com", max_age_secs=3600)
+
+    assert body == "User-agent: *\nDisallow: /x"
+    assert robots_store.load_robots_body("other.com", max_age_secs=3600) is None
+
+
+def test_store_ignores_expired_body(robots_store, monkeypatch):
+    """Test a stored body older than max_age_secs is treated as missing."""
+    robots_store.save_robots_body("example.com", ["User-agent: *"])
+    later = time.time() + 7200
+    monkeypatch.setattr(robots_store.time, "time", lambda: later)
+
+    assert robots_store.load_robots_body("example.com", max_age_secs=3600) is None
+
+
+def test_fallback_store_path_is_outside_the_working_tree():
+    """Test the unconfigured store file does not land in the current directory."""
+    path = CrawlerConfig.model_fields["crawler_robots_store_path"].default
+
+    assert os.path.isabs(path)
+    assert os.path.dirname(path) == tempfile.gettempdir()
+
+
+def test_store_path_comes_from_the_environment(monkeypatch):
+    """Test deployments can point the store at a persistent volume."""
+    monkeypatch.setenv("CRAWLER_ROBOTS_STORE_PATH", "/data/robots_cache.db")
+
+    assert CrawlerConfig().crawler_robots_store_path == "/data/robots_cache.db"
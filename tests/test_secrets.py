@@ -0,0 +1,96 @@
+"""Tests for the Secret Manager lookup cache."""
+
+import pytest
+from cachetools import TTLCache  # type: ignore[import-untyped]
+
+from app.utils import secrets
+from app.utils.secrets import SecretManagerClient
+
+
+class _Clock:
+    """Manually advanced timer for TTLCache."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Swap in an empty secrets cache driven by a fake clock."""
+    timer = _Clock()
+    monkeypatch.setattr(
+        secrets,
+        "_secrets_cache",
+        TTLCache(
+            maxsize=secrets.SECRETS_CACHE_MAXSIZE,
+            ttl=secrets.SECRETS_CACHE_TTL_SECS,
+            timer=timer,
+        ),
+    )
+    return timer
+
+
+def _recording_client(monkeypatch, project_id):
+    """Client whose Secret Manager access is recorded instead of performed."""
+    client = SecretManagerClient(project_id=project_id)
+    client.calls = []
+
+    def fake_access(secret_name, version):
+        client.calls.append((secret_name, version))
+        return f"{project_id}-{secret_name}-value-{len(client.calls)}"
+
+    monkeypatch.setattr(client, "_access_secret", fake_access)
+    return client
+
+
+@pytest.fixture
+def client(monkeypatch, clock):
+    """Recording client for a single test project."""
+    return _recording_client(monkeypatch, "test")
+
+
+def test_secret_cache_hit(client):
+    """Test repeated lookups within the TTL reuse the cached value."""
+    assert client.get_secret("api-key") == "test-api-key-value-1"
+    assert client.get_secret("api-key") == "test-api-key-value-1"
+    assert client.calls == [("api-key", "latest")]
+
+
+def test_secret_cache_keys_on_version(client):
+    """Test different versions of one secret are cached separately."""
+    client.get_secret("api-key")
+    client.get_secret("api-key", version="2")
+
+    assert client.calls == [("api-key", "latest"), ("api-key", "2")]
+
+
+def test_secret_cache_expires(client, clock):
+    """Test a cached secret is fetched again once the TTL has passed."""
+    client.get_secret("api-key")
+    clock.now += secrets.SECRETS_CACHE_TTL_SECS + 1
+
+    assert client.get_secret("api-key") == "test-api-key-value-2"
+    assert len(client.calls) == 2
+
+
+def test_failed_lookup_is_not_cached(client, monkeypatch):
+    """Test a None result from Secret Manager is retried on the next call."""
+    monkeypatch.setattr(client, "_access_secret", lambda name, version: None)
+    assert client.get_secret("api-key") is None
+
+    monkeypatch.setattr(client, "_access_secret", lambda name, version: "value")
+    assert client.get_secret("api-key") == "value"
+
+
+def test_secret_cache_keys_on_project(monkeypatch, clock):
+    """Test the same secret name in two projects is cached per project."""
+    first = _recording_client(monkeypatch, "project-a")
+    second = _recording_client(monkeypatch, "project-b")
+
+    assert first.get_secret("api-key") == "project-a-api-key-value-1"
+    assert second.get_secret("api-key") == "project-b-api-key-value-1"
+    assert first.get_secret("api-key") == "project-a-api-key-value-1"
+    assert first.calls == second.calls == [("api-key", "latest")]
@@ -0,0 +1,97 @@
+"""Tests for the sentiment result cache and batch analysis."""
+
+import pytest
+from cachetools import LRUCache  # type: ignore[import-untyped]
+
+from app.config import config
+from app.utils import sentiment
+
+
+@pytest.fixture
+def vader_calls(monkeypatch, vader_sentiment):
+    """Use VADER with an empty cache and record every provider batch call."""
+    monkeypatch.setattr(
+        sentiment,
+        "_sentiment_cache",
+        LRUCache(maxsize=sentiment.SENTIMENT_CACHE_MAXSIZE),
+    )
+
+    calls = []
+    score_batch = sentiment.analyze_sentiment_vader_batch
+
+    def recording_batch(texts):
+        calls.append(list(texts))
+        return score_batch(texts)
+
+    monkeypatch.setattr(sentiment, "analyze_sentiment_vader_batch", recording_batch)
+    return calls
+
+
+def test_batch_dedupes_and_keeps_order(vader_calls):
+    """Test duplicate texts are scored once and results follow input order."""
+    texts = ["Great win!", "Terrible loss.", "Great win!", "  "]
+
+    results = sentiment.analyze_sentiment_batch(texts)
+
+    assert vader_calls == [["Great win!", "Terrible loss."]]
+    assert results[0] == results[2]
+    assert results[0][0] == "positive"
+    assert results[1][0] == "negative"
+    assert results[3] == ("neutral", 0.0)
+
+
+def test_batch_matches_single_text_analysis(vader_calls):
+    """Test batch results equal per-text analyze_sentiment results."""
+    texts = ["Great win!", "Terrible loss.", "The meeting is at noon."]
+
+    batch = sentiment.analyze_sentiment_batch(texts)
+    sentiment.reload_sentiment_thresholds()
+
+    assert batch == [sentiment.analyze_sentiment(text) for text in texts]
+
+
+def test_batch_reuses_cached_results(vader_calls):
+    """Test a second batch only sends texts that are not cached yet."""
+    sentiment.analyze_sentiment_batch(["Great win!"])
+    sentiment.analyze_sentiment("Terrible loss.")
+
+    sentiment.analyze_sentiment_batch(["Great win!", "Terrible loss.", "New story"])
+
+    assert vader_calls == [["Great win!"], ["New story"]]
+
+
+def test_reload_thresholds_invalidates_cache(vader_calls):
+    """Test reloading thresholds forces cached texts to be re-scored."""
+    sentiment.analyze_sentiment_batch(["Great win!"])
+
+    sentiment.reload_sentiment_thresholds()
+    sentiment.analyze_sentiment_batch(["Great win!"])
+
+    assert vader_calls == [["Great win!"], ["Great win!"]]
+
+
+def test_gcp_fallback_results_are_not_cached(vader_calls, monkeypatch):
+    """Test results without a GCP NL magnitude are re-scored next time."""
+    gcp_calls = []
+
+    def failing_gcp_batch(texts):
+        gcp_calls.append(list(texts))
+        return [("neutral", 0.0, None)] * len(texts)
+
+    monkeypatch.setattr(config.sentiment, "sentiment_provider", "GCP_NL")
+    sentiment.reload_sentiment_thresholds()
+    monkeypatch.setattr(sentiment, "analyze_sentiment_gcp_nl_batch", failing_gcp_batch)
+
+    sentiment.analyze_sentiment_batch(["Great win!"])
+    sentiment.analyze_sentiment_batch(["Great win!"])
+
+    assert gcp_calls == [["Great win!"], ["Great win!"]]
+
+
+def test_provider_info_reports_the_dispatching_provider(vader_sentiment):
+    """Test provider info follows the provider analyze_sentiment actually uses."""
+    info = sentiment.get_sentiment_provider_info()
+
+    assert sentiment.get_sentiment_provider() == "VADER"
+    assert info["provider"] == "VADER"
+    assert info["positive_threshold"] == config.sentiment.vader_positive_threshold